@@ -0,0 +1,294 @@
+from array import array
+
+NULL = -1
+
+
+class ArrayLinkedList:
+    # Same API as LinkedList, but nodes are integer handles into two parallel
+    # buffers: values[h] holds the value and next[h] the handle of the next
+    # node (NULL at the end). Slots freed by pop/remove are chained through
+    # next[] into a free list and reused before the buffers grow, so there is
+    # no per-node object for the allocator or the GC to deal with.
+    #
+    # typecode=None keeps values in a plain list (any Python value); pass an
+    # array typecode such as "q" or "d" to store numbers unboxed.
+    def __init__(self, value, typecode=None):
+        self.values = [] if typecode is None else array(typecode)
+        self.next = array("q")
+        self.free = NULL
+        self.head = NULL
+        self.tail = NULL
+        self.length = 0
+        self.append(value)
+
+    def _alloc(self, value):
+        handle = self.free
+        if handle == NULL:
+            self.values.append(value)
+            self.next.append(NULL)
+            return len(self.next) - 1
+        # store first: a value the typed array rejects must not use up the slot
+        self.values[handle] = value
+        self.free = self.next[handle]
+        self.next[handle] = NULL
+        return handle
+
+    def _release(self, handle):
+        if type(self.values) is list:
+            self.values[handle] = None
+        self.next[handle] = self.free
+        self.free = handle
+
+    def print_list(self):
+        values, nxt = self.values, self.next
+        temp = self.head
+        while temp != NULL:
+            print(values[temp])
+            temp = nxt[temp]
+
+    def append(self, value):
+        new_node = self._alloc(value)
+        if self.head == NULL:
+            self.head = new_node
+        else:
+            self.next[self.tail] = new_node
+        self.tail = new_node
+        self.length += 1
+        return True
+
+    def pop(self):
+        if self.length == 0:
+            return None
+        nxt = self.next
+        temp = self.head
+        prev = NULL
+        while nxt[temp] != NULL:
+            prev = temp
+            temp = nxt[temp]
+        if prev == NULL:
+            self.head = NULL
+        else:
+            nxt[prev] = NULL
+        self.tail = prev
+        self.length -= 1
+        value = self.values[temp]
+        self._release(temp)
+        return value
+
+    def prepend(self, value):
+        new_node = self._alloc(value)
+        if self.head == NULL:
+            self.tail = new_node
+        else:
+            self.next[new_node] = self.head
+        self.head = new_node
+        self.length += 1
+        return True
+
+    def pop_first(self):
+        if self.length == 0:
+            return None
+        temp = self.head
+        self.head = self.next[temp]
+        self.length -= 1
+        if self.length == 0:
+            self.tail = NULL
+        value = self.values[temp]
+        self._release(temp)
+        return value
+
+    def get(self, index):
+        # returns the node handle; read it with values[handle]
+        if index < 0 or index >= self.length:
+            return None
+        nxt = self.next
+        temp = self.head
+        for _ in range(index):
+            temp = nxt[temp]
+        return temp
+
+    def set_value(self, index, value):
+        temp = self.get(index)
+        if temp is not None:
+            self.values[temp] = value
+            return True
+        return False
+
+    def insert(self, index, value):
+        if index < 0 or index > self.length:
+            return False
+        if index == 0:
+            return self.prepend(value)
+        if index == self.length:
+            return self.append(value)
+        prev = self.get(index - 1)
+        new_node = self._alloc(value)
+        self.next[new_node] = self.next[prev]
+        self.next[prev] = new_node
+        self.length += 1
+        return True
+
+    def remove(self, index):
+        if index < 0 or index >= self.length:
+            return None
+        if index == 0:
+            return self.pop_first()
+        if index == self.length - 1:
+            return self.pop()
+        prev = self.get(index - 1)
+        removed = self.next[prev]
+        self.next[prev] = self.next[removed]
+        self.length -= 1
+        value = self.values[removed]
+        self._release(removed)
+        return value
+
+    def reverse(self):
+        nxt = self.next
+        temp = self.head
+        self.head = self.tail
+        self.tail = temp
+        before = NULL
+        while temp != NULL:
+            after = nxt[temp]
+            nxt[temp] = before
+            before = temp
+            temp = after
+
+    def reverse_between(self, start_index, end_index):
+        if self.length <= 1 or start_index >= end_index:
+            return
+        if start_index < 0 or end_index >= self.length:
+            return
+        nxt = self.next
+        # previous_node is NULL when the reversal starts at head
+        previous_node = NULL
+        current_node = self.head
+        for _ in range(start_index):
+            previous_node = current_node
+            current_node = nxt[current_node]
+        first_moved = current_node
+        for _ in range(end_index - start_index):
+            node_to_move = nxt[current_node]
+            nxt[current_node] = nxt[node_to_move]
+            if previous_node == NULL:
+                nxt[node_to_move] = self.head
+                self.head = node_to_move
+            else:
+                nxt[node_to_move] = nxt[previous_node]
+                nxt[previous_node] = node_to_move
+        if end_index == self.length - 1:
+            self.tail = first_moved
+
+    def partition_list(self, x):
+        if self.head == NULL:
+            return
+        values, nxt = self.values, self.next
+        less_head = less_tail = NULL
+        more_head = more_tail = NULL
+        current = self.head
+        while current != NULL:
+            after = nxt[current]
+            nxt[current] = NULL
+            if values[current] < x:
+                if less_tail == NULL:
+                    less_head = current
+                else:
+                    nxt[less_tail] = current
+                less_tail = current
+            else:
+                if more_tail == NULL:
+                    more_head = current
+                else:
+                    nxt[more_tail] = current
+                more_tail = current
+            current = after
+        if less_tail == NULL:
+            self.head = more_head
+            self.tail = more_tail
+        else:
+            nxt[less_tail] = more_head
+            self.head = less_head
+            self.tail = less_tail if more_tail == NULL else more_tail
+
+    def remove_duplicates(self):
+        values, nxt = self.values, self.next
+        seen = set()
+        previous = NULL
+        current = self.head
+        while current != NULL:
+            after = nxt[current]
+            if values[current] in seen:
+                nxt[previous] = after
+                self.length -= 1
+                self._release(current)
+            else:
+                seen.add(values[current])
+                previous = current
+            current = after
+        self.tail = previous
+
+
+if __name__ == "__main__":
+    def to_list(ll):
+        result = []
+        temp = ll.head
+        while temp != NULL:
+            result.append(ll.values[temp])
+            temp = ll.next[temp]
+        if result:
+            assert ll.values[ll.tail] == result[-1]
+        assert len(result) == ll.length
+        return result
+
+    ll = ArrayLinkedList(1, typecode="q")
+    for value in (2, 3, 4, 5):
+        ll.append(value)
+    print("append:", to_list(ll))
+
+    print("pop:", ll.pop())
+    print("pop_first:", ll.pop_first())
+    ll.append(6)
+    ll.prepend(0)
+    print("slots reused:", (len(ll.next), to_list(ll)))
+
+    ll.insert(2, 9)
+    print("insert:", to_list(ll))
+    print("get:", ll.values[ll.get(2)])
+    print("remove:", ll.remove(2))
+    ll.set_value(0, 1)
+    print("set_value:", to_list(ll))
+
+    ll.reverse()
+    print("reverse:", to_list(ll))
+
+    ll.reverse_between(1, 4)
+    print("reverse_between:", to_list(ll))
+
+    ll.partition_list(3)
+    print("partition_list:", to_list(ll))
+
+    ll = ArrayLinkedList(1)
+    for value in (2, 1, 3, 2, 3):
+        ll.append(value)
+    ll.remove_duplicates()
+    print("remove_duplicates:", to_list(ll))
+
+
+"""
+    EXPECTED OUTPUT:
+    ----------------
+    append: [1, 2, 3, 4, 5]
+    pop: 5
+    pop_first: 1
+    slots reused: (5, [0, 2, 3, 4, 6])
+    insert: [0, 2, 9, 3, 4, 6]
+    get: 9
+    remove: 9
+    set_value: [1, 2, 3, 4, 6]
+    reverse: [6, 4, 3, 2, 1]
+    reverse_between: [6, 1, 2, 3, 4]
+    partition_list: [1, 2, 6, 3, 4]
+    remove_duplicates: [1, 2, 3]
+
+"""
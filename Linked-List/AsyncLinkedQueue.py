@@ -0,0 +1,165 @@
+import asyncio
+from collections import deque
+
+from LinkedList import LinkedList
+
+
+class QueueClosed(Exception):
+    pass
+
+
+class AsyncLinkedQueue:
+    # asyncio queue stored on a LinkedList node chain.
+    #
+    # maxsize > 0 bounds the queue: put() waits until a get frees a slot,
+    # which pushes back on fast producers. get_many(n) detaches up to n
+    # nodes at once with split_at, so a batch costs one O(n) walk instead of
+    # n separate gets. After close(), put() raises QueueClosed and
+    # `async for` stops once the queue has drained.
+    #
+    # Waiters are futures woken one at a time, the same scheme asyncio.Queue
+    # uses; like it, this class is not thread-safe.
+    def __init__(self, maxsize=0):
+        self.maxsize = maxsize
+        self._items = LinkedList()
+        self._getters = deque()
+        self._putters = deque()
+        self._closed = False
+
+    def __len__(self):
+        return self._items.length
+
+    def qsize(self):
+        return self._items.length
+
+    def empty(self):
+        return self._items.length == 0
+
+    def full(self):
+        return 0 < self.maxsize <= self._items.length
+
+    def _wakeup_next(self, waiters):
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    async def _wait(self, waiters, still_blocked):
+        while still_blocked():
+            waiter = asyncio.get_running_loop().create_future()
+            waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+                try:
+                    waiters.remove(waiter)
+                except ValueError:
+                    pass
+                # pass a wakeup we may have swallowed on to the next waiter
+                if not still_blocked() and not waiter.cancelled():
+                    self._wakeup_next(waiters)
+                raise
+
+    def put_nowait(self, value):
+        if self._closed:
+            raise QueueClosed("put on a closed queue")
+        if self.full():
+            raise asyncio.QueueFull
+        self._items.append(value)
+        self._wakeup_next(self._getters)
+
+    async def put(self, value):
+        await self._wait(self._putters, lambda: self.full() and not self._closed)
+        self.put_nowait(value)
+
+    def get_nowait(self):
+        if self._items.length == 0:
+            if self._closed:
+                raise QueueClosed("get on a closed, empty queue")
+            raise asyncio.QueueEmpty
+        value = self._items.pop_first().value
+        self._wakeup_next(self._putters)
+        return value
+
+    async def get(self):
+        await self._wait(self._getters, lambda: self._items.length == 0 and not self._closed)
+        return self.get_nowait()
+
+    async def get_many(self, n):
+        # waits for at least one value, then returns up to n of them as a
+        # LinkedList detached from the front of the queue
+        if n < 1:
+            raise ValueError("n must be at least 1")
+        await self._wait(self._getters, lambda: self._items.length == 0 and not self._closed)
+        if self._items.length == 0:
+            raise QueueClosed("get on a closed, empty queue")
+        batch = self._items
+        self._items = batch.split_at(min(n, batch.length))
+        for _ in range(batch.length):
+            if not self._putters:
+                break
+            self._wakeup_next(self._putters)
+        if self._items.length:
+            # values are left over for the next waiting getter
+            self._wakeup_next(self._getters)
+        return batch
+
+    def close(self):
+        self._closed = True
+        while self._getters:
+            self._wakeup_next(self._getters)
+        while self._putters:
+            self._wakeup_next(self._putters)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return await self.get()
+        except QueueClosed:
+            raise StopAsyncIteration
+
+
+if __name__ == "__main__":
+    async def main():
+        queue = AsyncLinkedQueue(maxsize=3)
+        high_water = 0
+
+        async def producer(base):
+            nonlocal high_water
+            for i in range(5):
+                await queue.put(base + i)
+                high_water = max(high_water, queue.qsize())
+
+        producers = [asyncio.create_task(producer(base)) for base in (0, 100)]
+        batch = await queue.get_many(2)
+        print("get_many:", list(batch), batch.length)
+        print("get:", await queue.get())
+
+        async def closer():
+            await asyncio.gather(*producers)
+            queue.close()
+
+        asyncio.create_task(closer())
+        rest = [value async for value in queue]
+        print("async for:", len(rest), "values, max queued", high_water)
+        try:
+            await queue.put(1)
+        except QueueClosed:
+            print("put after close: QueueClosed")
+
+    asyncio.run(main())
+
+
+"""
+    EXPECTED OUTPUT:
+    ----------------
+    get_many: [0, 1] 2
+    get: 2
+    async for: 7 values, max queued 3
+    put after close: QueueClosed
+
+"""
@@ -0,0 +1,69 @@
+import asyncio
+import time
+
+from AsyncLinkedQueue import AsyncLinkedQueue
+
+PRODUCERS = 200
+ITEMS_PER_PRODUCER = 500
+MAXSIZE = 1000
+BATCH = 100
+
+
+async def run(queue, batched):
+    # many producers, one consumer; each item carries its enqueue time
+    total = PRODUCERS * ITEMS_PER_PRODUCER
+    latencies = []
+
+    async def producer():
+        for _ in range(ITEMS_PER_PRODUCER):
+            await queue.put(time.perf_counter())
+            await asyncio.sleep(0)
+
+    async def consumer():
+        while len(latencies) < total:
+            if batched:
+                stamps = await queue.get_many(BATCH)
+            else:
+                stamps = [await queue.get()]
+            now = time.perf_counter()
+            for stamp in stamps:
+                latencies.append(now - stamp)
+
+    start = time.perf_counter()
+    await asyncio.gather(consumer(), *(producer() for _ in range(PRODUCERS)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return (total / elapsed,
+            latencies[len(latencies) // 2] * 1e3,
+            latencies[int(len(latencies) * 0.99)] * 1e3)
+
+
+if __name__ == "__main__":
+    cases = [
+        ("asyncio.Queue", lambda: asyncio.Queue(MAXSIZE), False),
+        ("AsyncLinkedQueue.get", lambda: AsyncLinkedQueue(MAXSIZE), False),
+        (f"AsyncLinkedQueue.get_many({BATCH})", lambda: AsyncLinkedQueue(MAXSIZE), True),
+    ]
+    print(f"{PRODUCERS} producers x {ITEMS_PER_PRODUCER} items, maxsize {MAXSIZE}")
+    print(f"{'queue':>30} {'items/s':>10} {'p50 ms':>8} {'p99 ms':>8}")
+    for name, make_queue, batched in cases:
+        async def case():
+            return await run(make_queue(), batched)
+        rate, p50, p99 = asyncio.run(case())
+        print(f"{name:>30} {rate:>10,.0f} {p50:>8.2f} {p99:>8.2f}")
+
+
+"""
+    SAMPLE OUTPUT (CPython 3.11, 1 CPU):
+    ------------------------------------
+    200 producers x 500 items, maxsize 1000
+                             queue    items/s   p50 ms   p99 ms
+                     asyncio.Queue    169,330     0.57     1.13
+              AsyncLinkedQueue.get    132,460     0.72     1.52
+    AsyncLinkedQueue.get_many(100)    179,823     0.54     1.24
+
+    One value per get() is slower than asyncio.Queue, which keeps its items
+    in a C deque where each get here pops a Node. get_many() wakes the
+    consumer once per batch instead of once per value, which brings it level
+    with (run to run, slightly ahead of) asyncio.Queue at similar latency.
+"""
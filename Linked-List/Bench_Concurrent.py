@@ -0,0 +1,78 @@
+import threading
+import time
+
+from LinkedList import LinkedList
+from ConcurrentLinkedList import ConcurrentLinkedList
+
+OPS_PER_THREAD = 50_000
+
+
+class GlobalLockList:
+    # what callers did before: every call wrapped in one shared lock
+    def __init__(self):
+        self._list = LinkedList()
+        self._lock = threading.Lock()
+
+    def append(self, value):
+        with self._lock:
+            return self._list.append(value)
+
+    def pop_first(self):
+        with self._lock:
+            node = self._list.pop_first()
+        return None if node is None else node.value
+
+
+def run(shared, threads):
+    # half the threads produce, half consume; a single thread alternates
+    def producer():
+        for i in range(OPS_PER_THREAD):
+            shared.append(i)
+
+    def consumer():
+        for _ in range(OPS_PER_THREAD):
+            shared.pop_first()
+
+    def both():
+        for i in range(OPS_PER_THREAD // 2):
+            shared.append(i)
+            shared.pop_first()
+
+    if threads == 1:
+        workers = [threading.Thread(target=both)]
+    else:
+        workers = [threading.Thread(target=producer if n % 2 == 0 else consumer)
+                   for n in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+    return threads * OPS_PER_THREAD / elapsed
+
+
+if __name__ == "__main__":
+    print(f"{'threads':>7} {'global lock ops/s':>18} {'two-lock ops/s':>15}")
+    for threads in (1, 2, 4, 8):
+        global_ops = run(GlobalLockList(), threads)
+        two_lock_ops = run(ConcurrentLinkedList(), threads)
+        print(f"{threads:>7} {global_ops:>18,.0f} {two_lock_ops:>15,.0f}")
+
+
+"""
+    SAMPLE OUTPUT (CPython 3.11 with the GIL, 1 CPU):
+    -------------------------------------------------
+    threads  global lock ops/s  two-lock ops/s
+          1            937,743         417,319
+          2            976,471         486,796
+          4            837,378         424,785
+          8            809,789         391,431
+
+    Under the GIL only one thread runs Python code at a time, so splitting
+    the lock cannot add throughput here, and the two-lock list pays for its
+    extra lock operations and a Lock per node. What it does buy is that a
+    producer never waits behind a consumer (or a long insert/remove walk)
+    holding the one global lock. Any throughput gain needs a
+    free-threaded build and several cores; it was not measured here.
+"""
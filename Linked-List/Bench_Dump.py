@@ -0,0 +1,65 @@
+import os
+import tempfile
+import time
+
+from LinkedList import LinkedList
+from MappedLinkedList import MappedLinkedList
+
+COUNT = 1_000_000
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def text_dump(ll, path):
+    # what callers did before: print_list to a file, then parse it back
+    with open(path, "w") as file:
+        ll.print_list(file)
+
+
+def text_load(path):
+    with open(path) as file:
+        return LinkedList.from_iterable(int(line) for line in file)
+
+
+if __name__ == "__main__":
+    ll = LinkedList.from_iterable(range(-COUNT // 2, COUNT // 2))
+    with tempfile.TemporaryDirectory() as directory:
+        text_path = os.path.join(directory, "list.txt")
+        binary_path = os.path.join(directory, "list.llb")
+
+        text_write, _ = timed(lambda: text_dump(ll, text_path))
+        text_read, _ = timed(lambda: text_load(text_path))
+        binary_write, _ = timed(lambda: ll.dump(binary_path))
+        binary_read, loaded = timed(lambda: LinkedList.load(binary_path))
+        assert list(loaded) == list(ll)
+        map_open, view = timed(lambda: MappedLinkedList(binary_path))
+        map_get, value = timed(lambda: view.get(COUNT // 3))
+        assert value == ll.get(COUNT // 3).value
+        view.close()
+
+        print(f"{COUNT:,} ints")
+        print(f"{'format':>8} {'size MB':>8} {'write s':>8} {'read s':>8}")
+        print(f"{'text':>8} {os.path.getsize(text_path) / 1e6:>8.1f} {text_write:>8.3f} {text_read:>8.3f}")
+        print(f"{'binary':>8} {os.path.getsize(binary_path) / 1e6:>8.1f} {binary_write:>8.3f} {binary_read:>8.3f}")
+        print(f"mmap open {map_open * 1e6:.0f} us, get({COUNT // 3}) {map_get * 1e6:.0f} us")
+
+
+"""
+    SAMPLE OUTPUT (CPython 3.11):
+    -----------------------------
+    1,000,000 ints
+      format  size MB  write s   read s
+        text      7.3    0.431    1.588
+      binary      8.0    0.118    0.800
+    mmap open 244 us, get(333333) 10 us
+
+    Most of load()'s time goes into building the Nodes; reading the file is
+    a few read() + array.frombytes() calls. For small ints like these, 8
+    bytes each is a little more than their decimal text, but the size is
+    fixed, nothing has to be parsed, and floats round-trip exactly. Opening the mapped view
+    only reads the header, so it takes the same time for any file size.
+"""
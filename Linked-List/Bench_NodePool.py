@@ -0,0 +1,74 @@
+import gc
+import time
+
+from LinkedList import LinkedList
+from NodePool import NodePool
+
+OPS = 500_000
+DEPTH = 1_000
+
+
+def queue_churn(ll, ops):
+    for i in range(ops):
+        ll.append(i)
+        ll.pop_first_value()
+
+
+def middle_churn(ll, ops):
+    # insert/remove a few nodes in, so the walk stays short
+    for i in range(ops):
+        ll.insert(3, i)
+        ll.remove_value(3)
+
+
+def burst_churn(ll, ops):
+    # grow by DEPTH nodes, then drain them again
+    for _ in range(ops // DEPTH):
+        for i in range(DEPTH):
+            ll.append(i)
+        for _ in range(DEPTH):
+            ll.pop_first_value()
+
+
+def run(workload, pool):
+    ll = LinkedList.from_iterable(range(DEPTH), pool=pool)
+    gc.collect()
+    collections = sum(stat["collections"] for stat in gc.get_stats())
+    start = time.perf_counter()
+    workload(ll, OPS)
+    elapsed = time.perf_counter() - start
+    collections = sum(stat["collections"] for stat in gc.get_stats()) - collections
+    return OPS / elapsed, collections
+
+
+if __name__ == "__main__":
+    print(f"{'workload':>12} {'pool':>5} {'ops/s':>10} {'gc runs':>8} {'hits':>8} {'misses':>7}")
+    workloads = (("append/pop", queue_churn), ("insert/remove", middle_churn),
+                 ("bursts", burst_churn))
+    for name, workload in workloads:
+        for pool in (None, NodePool(cap=2 * DEPTH)):
+            rate, collections = run(workload, pool)
+            hits, misses = ("-", "-") if pool is None else (pool.hits, pool.misses)
+            print(f"{name:>12} {'no' if pool is None else 'yes':>5} {rate:>10,.0f} {collections:>8} {hits:>8} {misses:>7}")
+
+
+"""
+    SAMPLE OUTPUT (CPython 3.11, 1 CPU):
+    ------------------------------------
+        workload  pool      ops/s  gc runs     hits  misses
+      append/pop    no  1,002,414        0        -       -
+      append/pop   yes  1,105,882        0   499999    1001
+    insert/remove    no    499,961        0        -       -
+    insert/remove   yes    544,611        0   499999    1001
+          bursts    no    907,301      500        -       -
+          bursts   yes  1,051,273        1   499000    2000
+
+    Both sides remove with the *_value methods, which give the node back
+    to the pool when there is one. CPython already recycles small objects
+    cheaply, so a pooled acquire (a Python method call) costs about what
+    Node(value) does, and ops/s moved by roughly 10% either way from run to
+    run. The clear difference is in the collector: bursts that grow the list
+    allocate faster than they free and keep triggering generation-0
+    collections, which reused nodes do not. The misses are the DEPTH nodes
+    from_iterable builds at the start.
+"""
@@ -0,0 +1,129 @@
+import threading
+import time
+
+import LinkedList as linked_list_module
+import SPSCQueue as spsc_module
+from Node import Node
+from LinkedList import LinkedList
+from SPSCQueue import SPSCQueue
+
+OPS = 1_000_000
+DEPTH = 64
+
+
+class CountingNode(Node):
+    __slots__ = ()
+    created = 0
+
+    def __init__(self, value):
+        CountingNode.created += 1
+        super().__init__(value)
+
+
+class LinkedListQueue:
+    # the current class used as a queue: a new Node per append
+    def __init__(self, capacity):
+        self._list = LinkedList()
+
+    def append(self, value):
+        return self._list.append(value)
+
+    def pop_first(self):
+        node = self._list.pop_first()
+        return None if node is None else node.value
+
+
+class LockedLinkedListQueue(LinkedListQueue):
+    # LinkedList is not safe to share between threads without a lock
+    def __init__(self, capacity):
+        super().__init__(capacity)
+        self._lock = threading.Lock()
+
+    def append(self, value):
+        with self._lock:
+            return self._list.append(value)
+
+    def pop_first(self):
+        with self._lock:
+            node = self._list.pop_first()
+        return None if node is None else node.value
+
+
+def steady_state(queue, ops):
+    # keep DEPTH values queued and push/pop one pair per op
+    for i in range(DEPTH):
+        queue.append(i)
+    append = queue.append
+    pop_first = queue.pop_first
+    start = time.perf_counter()
+    for i in range(ops):
+        append(i)
+        pop_first()
+    return ops / (time.perf_counter() - start)
+
+
+def nodes_created(make_queue, ops):
+    # swap in a counting Node just for this run
+    saved = linked_list_module.Node, spsc_module.Node
+    linked_list_module.Node = spsc_module.Node = CountingNode
+    try:
+        queue = make_queue()
+        for i in range(DEPTH):
+            queue.append(i)
+        CountingNode.created = 0
+        for i in range(ops):
+            queue.append(i)
+            queue.pop_first()
+        return CountingNode.created
+    finally:
+        linked_list_module.Node, spsc_module.Node = saved
+
+
+def two_threads(queue, ops):
+    # one producer thread, one consumer thread; sleep(0) yields the GIL
+    def producer():
+        for i in range(ops):
+            while not queue.append(i):
+                time.sleep(0)
+
+    def consumer():
+        got = 0
+        while got < ops:
+            if queue.pop_first() is None:
+                time.sleep(0)
+            else:
+                got += 1
+
+    threads = [threading.Thread(target=producer), threading.Thread(target=consumer)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return ops / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    cases = [("LinkedList", LinkedListQueue, LockedLinkedListQueue),
+             ("SPSCQueue", SPSCQueue, SPSCQueue)]
+    print(f"{'queue':>10} {'1 thread ops/s':>15} {'2 threads ops/s':>16} {'nodes allocated':>16}")
+    for name, queue_class, threaded_class in cases:
+        single = steady_state(queue_class(DEPTH * 2), OPS)
+        threaded = two_threads(threaded_class(1024), OPS // 5)
+        created = nodes_created(lambda: queue_class(DEPTH * 2), OPS // 10)
+        print(f"{name:>10} {single:>15,.0f} {threaded:>16,.0f} {created:>16,}")
+
+
+"""
+    SAMPLE OUTPUT (CPython 3.11, 1 CPU):
+    ------------------------------------
+         queue  1 thread ops/s  2 threads ops/s  nodes allocated
+    LinkedList         876,312          370,008          100,000
+     SPSCQueue       2,592,921        1,781,535                0
+
+    One op is an append plus a pop_first. "nodes allocated" counts Node
+    objects created over 100,000 steady-state ops: the LinkedList makes and
+    drops one per op, while the ring's nodes all exist from __init__ on.
+    The two-thread LinkedList run needs a lock around every call; the SPSC
+    queue needs none for one producer and one consumer.
+"""
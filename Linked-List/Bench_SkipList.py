@@ -0,0 +1,52 @@
+import random
+import time
+
+from LinkedList import LinkedList
+from SkipList import SkipList
+
+OPS = 100
+
+
+def build(list_class, size):
+    ll = list_class(0)
+    for value in range(1, size):
+        ll.append(value)
+    return ll
+
+
+def time_ops(ll, size, rng):
+    # microseconds per call for random positional get / insert / remove
+    indexes = [rng.randrange(size) for _ in range(OPS)]
+    results = []
+    for operation in (lambda i: ll.get(i),
+                      lambda i: ll.insert(i, -1),
+                      lambda i: ll.remove(i)):
+        start = time.perf_counter()
+        for index in indexes:
+            operation(index)
+        results.append((time.perf_counter() - start) / OPS * 1e6)
+    return results
+
+
+if __name__ == "__main__":
+    print(f"{'size':>9} {'class':>10} {'get us':>10} {'insert us':>10} {'remove us':>10}")
+    for size in (10 ** 4, 10 ** 5, 10 ** 6):
+        for list_class in (LinkedList, SkipList):
+            ll = build(list_class, size)
+            get_us, insert_us, remove_us = time_ops(ll, size, random.Random(size))
+            print(f"{size:>9} {list_class.__name__:>10} "
+                  f"{get_us:>10.1f} {insert_us:>10.1f} {remove_us:>10.1f}")
+
+
+"""
+    SAMPLE OUTPUT (CPython 3.11):
+    -----------------------------
+         size      class     get us  insert us  remove us
+        10000 LinkedList      117.1      118.3      121.8
+        10000   SkipList        6.6       10.1        9.6
+       100000 LinkedList     1740.4     1369.3     1683.1
+       100000   SkipList        9.6        9.0        8.4
+      1000000 LinkedList    17650.6    18233.7    16831.6
+      1000000   SkipList       14.8       22.6       26.0
+
+"""
@@ -0,0 +1,68 @@
+import random
+import time
+
+from LinkedList import LinkedList
+
+
+def nearly_sorted(size, rng):
+    values = list(range(size))
+    for _ in range(size // 100):
+        i = rng.randrange(size)
+        j = rng.randrange(size)
+        values[i], values[j] = values[j], values[i]
+    return values
+
+
+def copy_sort_rebuild(ll):
+    # the old round trip: copy out, sort the Python list, rebuild every Node
+    return LinkedList.from_iterable(sorted(ll))
+
+
+def in_place(ll):
+    ll.sort()
+    return ll
+
+
+def time_sort(sort_function, values):
+    ll = LinkedList.from_iterable(values)
+    start = time.perf_counter()
+    result = sort_function(ll)
+    elapsed = time.perf_counter() - start
+    assert list(result) == sorted(values)
+    return elapsed * 1000
+
+
+if __name__ == "__main__":
+    rng = random.Random(42)
+    size = 10 ** 6
+    feeds = {
+        "sorted": list(range(size)),
+        "reversed": list(range(size, 0, -1)),
+        "nearly sorted": nearly_sorted(size, rng),
+        "random": [rng.random() for _ in range(size)],
+    }
+    print(f"{size} elements")
+    print(f"{'feed':>14} {'copy+sort+rebuild ms':>21} {'LinkedList.sort ms':>19}")
+    for name, values in feeds.items():
+        rebuild_ms = time_sort(copy_sort_rebuild, values)
+        sort_ms = time_sort(in_place, values)
+        print(f"{name:>14} {rebuild_ms:>21.0f} {sort_ms:>19.0f}")
+
+
+"""
+    SAMPLE OUTPUT (CPython 3.11):
+    -----------------------------
+    1000000 elements
+              feed  copy+sort+rebuild ms  LinkedList.sort ms
+            sorted                  1195                 151
+          reversed                  1281                 167
+     nearly sorted                  1194                 802
+            random                  1927                2936
+
+    Sorted and reversed feeds are one run each and take a single linear
+    pass. With 1% of positions swapped the runs are found in one pass and
+    merged off a run stack, and merging leaves long in-order stretches
+    linked as they are, so the in-place sort beats the round trip. Random
+    input has no runs to exploit: there the C-level sorted() wins even
+    though the round trip builds a new Node per value.
+"""
@@ -0,0 +1,266 @@
+import threading
+
+from Node import Node
+from LinkedList import _EMPTY
+
+
+class LockedNode(Node):
+    __slots__ = ("lock",)
+
+    def __init__(self, value):
+        super().__init__(value)
+        self.lock = threading.Lock()
+
+
+class ConcurrentLinkedList:
+    # Thread-safe LinkedList for producer/consumer use.
+    #
+    # head is a sentinel node and the first value lives at head.next (the
+    # Michael & Scott two-lock queue): append only takes the tail lock and
+    # pop_first only the head lock, so producers and consumers never wait on
+    # each other. insert/remove/get/pop walk with hand-over-hand node locks
+    # and only take the tail lock when they touch the last node.
+    #
+    # Lock order is head lock -> node locks front to back -> tail lock, and
+    # nothing waits on an earlier lock while holding a later one.
+    #
+    # Values are returned instead of nodes: nodes stay owned by the list.
+    def __init__(self, value=_EMPTY):
+        self.head = LockedNode(None)
+        self.tail = self.head
+        self.length = 0
+        self._head_lock = threading.Lock()
+        self._tail_lock = threading.Lock()
+        self._length_lock = threading.Lock()
+        if value is not _EMPTY:
+            self.append(value)
+
+    def _add_length(self, delta):
+        with self._length_lock:
+            self.length += delta
+
+    def _lock_before(self, index):
+        # Returns the locked node just before position `index` (the sentinel
+        # for 0), or None if the list is too short.
+        with self._head_lock:
+            prev = self.head
+            prev.lock.acquire()
+        for _ in range(index):
+            temp = prev.next
+            if temp is None:
+                prev.lock.release()
+                return None
+            temp.lock.acquire()
+            prev.lock.release()
+            prev = temp
+        return prev
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        # weakly consistent: sees a mix of before/after concurrent edits
+        temp = self.head.next
+        while temp is not None:
+            yield temp.value
+            temp = temp.next
+
+    def print_list(self):
+        for value in self:
+            print(value)
+
+    def append(self, value):
+        new_node = LockedNode(value)
+        with self._tail_lock:
+            self.tail.next = new_node
+            self.tail = new_node
+        self._add_length(1)
+        return True
+
+    def pop_first(self):
+        with self._head_lock:
+            sentinel = self.head
+            with sentinel.lock:
+                first = sentinel.next
+                if first is None:
+                    return None
+                with first.lock:
+                    # the popped node becomes the new sentinel
+                    value = first.value
+                    first.value = None
+                    self.head = first
+        self._add_length(-1)
+        return value
+
+    def prepend(self, value):
+        return self.insert(0, value)
+
+    def get(self, index):
+        if index < 0:
+            return None
+        prev = self._lock_before(index)
+        if prev is None:
+            return None
+        try:
+            temp = prev.next
+            return None if temp is None else temp.value
+        finally:
+            prev.lock.release()
+
+    def insert(self, index, value):
+        if index < 0:
+            return False
+        prev = self._lock_before(index)
+        if prev is None:
+            return False
+        new_node = LockedNode(value)
+        try:
+            if prev.next is None:
+                # prev may be the tail, which append also writes to
+                with self._tail_lock:
+                    new_node.next = prev.next
+                    prev.next = new_node
+                    if self.tail is prev:
+                        self.tail = new_node
+            else:
+                new_node.next = prev.next
+                prev.next = new_node
+        finally:
+            prev.lock.release()
+        self._add_length(1)
+        return True
+
+    def _unlink_after(self, prev, temp):
+        # prev and temp are locked and adjacent
+        if temp.next is None:
+            with self._tail_lock:
+                prev.next = temp.next
+                if self.tail is temp:
+                    self.tail = prev
+        else:
+            prev.next = temp.next
+        temp.next = None
+
+    def remove(self, index):
+        if index < 0:
+            return None
+        prev = self._lock_before(index)
+        if prev is None:
+            return None
+        try:
+            temp = prev.next
+            if temp is None:
+                return None
+            with temp.lock:
+                self._unlink_after(prev, temp)
+        finally:
+            prev.lock.release()
+        self._add_length(-1)
+        return temp.value
+
+    def pop(self):
+        prev = self._lock_before(0)
+        temp = prev.next
+        if temp is None:
+            prev.lock.release()
+            return None
+        temp.lock.acquire()
+        while True:
+            after = temp.next
+            if after is None:
+                with self._tail_lock:
+                    # an append may have landed since we looked
+                    if temp.next is None:
+                        prev.next = None
+                        self.tail = prev
+                        break
+                continue
+            after.lock.acquire()
+            prev.lock.release()
+            prev, temp = temp, after
+        temp.lock.release()
+        prev.lock.release()
+        self._add_length(-1)
+        return temp.value
+
+
+if __name__ == "__main__":
+    import random
+
+    cll = ConcurrentLinkedList(1)
+    cll.append(2)
+    cll.append(3)
+    cll.prepend(0)
+    cll.insert(2, 9)
+    print("single thread:", list(cll))
+    print("remove/pop/pop_first:", [cll.remove(2), cll.pop(), cll.pop_first()])
+    print("get:", [cll.get(0), cll.get(1), cll.get(2)])
+
+    # producers append, consumers pop_first, editors insert/remove markers
+    # (negative values) in the middle; nothing may be lost or duplicated
+    cll = ConcurrentLinkedList()
+    per_thread = 2000
+    seen = []
+    seen_lock = threading.Lock()
+    inserted = []
+    producing = threading.Event()
+    producing.set()
+
+    def producer(base):
+        for i in range(per_thread):
+            cll.append(base + i)
+
+    def consumer():
+        got = []
+        while True:
+            value = cll.pop_first()
+            if value is not None:
+                got.append(value)
+            elif not producing.is_set():
+                break
+        with seen_lock:
+            seen.extend(got)
+
+    def editor(seed):
+        rng = random.Random(seed)
+        got = []
+        markers = 0
+        for step in range(500):
+            if cll.insert(rng.randrange(8), -1 - step):
+                markers += 1
+            value = cll.remove(rng.randrange(8))
+            if value is not None:
+                got.append(value)
+            if rng.random() < 0.1:
+                value = cll.pop()
+                if value is not None:
+                    got.append(value)
+        with seen_lock:
+            seen.extend(got)
+            inserted.append(markers)
+
+    writers = [threading.Thread(target=producer, args=(n * per_thread,)) for n in range(4)]
+    writers += [threading.Thread(target=editor, args=(n,)) for n in range(2)]
+    readers = [threading.Thread(target=consumer) for _ in range(3)]
+    for thread in writers + readers:
+        thread.start()
+    for thread in writers:
+        thread.join()
+    producing.clear()
+    for thread in readers:
+        thread.join()
+    seen.extend(cll)
+    values = sorted(value for value in seen if value >= 0)
+    markers = sum(1 for value in seen if value < 0)
+    print("multithreaded:", (values == list(range(4 * per_thread)), markers == sum(inserted), cll.length))
+
+
+"""
+    EXPECTED OUTPUT:
+    ----------------
+    single thread: [0, 1, 9, 2, 3]
+    remove/pop/pop_first: [9, 3, 0]
+    get: [1, 2, None]
+    multithreaded: (True, True, 0)
+
+"""
@@ -0,0 +1,337 @@
+from Node import Node
+from LinkedList import Cursor, LinkedList
+
+
+class DoublyNode(Node):
+    __slots__ = ("prev",)
+
+    def __init__(self, value):
+        super().__init__(value)
+        self.prev = None
+
+
+class DoublyLinkedList(LinkedList):
+    # Same API as LinkedList, but every node also points back to the one
+    # before it, so pop() no longer has to walk from head to find the new tail.
+    _node_class = DoublyNode
+
+    def extend(self, iterable):
+        # same as LinkedList.extend, plus the prev links
+        if iterable is self:
+            iterable = list(self)
+        make_node = DoublyNode if self.pool is None else self.pool.acquire
+        head = tail = None
+        count = 0
+        for value in iterable:
+            new_node = make_node(value)
+            if tail is None:
+                head = new_node
+            else:
+                tail.next = new_node
+                new_node.prev = tail
+            tail = new_node
+            count += 1
+        if head is not None:
+            head.prev = self.tail
+            if self.tail is None:
+                self.head = head
+            else:
+                self.tail.next = head
+            self.tail = tail
+            self.length += count
+        if self.debug:
+            self.check_invariants()
+        return True
+
+    def check_invariants(self):
+        super().check_invariants()
+        before = None
+        temp = self.head
+        while temp is not None:
+            assert temp.prev is before, f"prev of {temp.value!r} does not point back"
+            before = temp
+            temp = temp.next
+        return True
+
+    def append(self, value):
+        new_node = DoublyNode(value) if self.pool is None else self.pool.acquire(value)
+        if self.head is None:
+            self.head = new_node
+            self.tail = new_node
+        else:
+            self.tail.next = new_node
+            new_node.prev = self.tail
+            self.tail = new_node
+        self.length += 1
+        if self.debug:
+            self.check_invariants()
+        return True
+
+    def pop(self):
+        if self.length == 0:
+            return None
+        temp = self.tail
+        if self.length == 1:
+            self.head = None
+            self.tail = None
+        else:
+            self.tail = temp.prev
+            self.tail.next = None
+            temp.prev = None
+        self.length -= 1
+        if self.debug:
+            self.check_invariants()
+        return temp
+
+    def prepend(self, value):
+        new_node = DoublyNode(value) if self.pool is None else self.pool.acquire(value)
+        if self.length == 0:
+            self.head = new_node
+            self.tail = new_node
+        else:
+            new_node.next = self.head
+            self.head.prev = new_node
+            self.head = new_node
+        self.length += 1
+        if self.debug:
+            self.check_invariants()
+        return True
+
+    def pop_first(self):
+        if self.length == 0:
+            return None
+        temp = self.head
+        if self.length == 1:
+            self.head = None
+            self.tail = None
+        else:
+            self.head = temp.next
+            self.head.prev = None
+            temp.next = None
+        self.length -= 1
+        if self.debug:
+            self.check_invariants()
+        return temp
+
+    def cursor(self, index=-1):
+        return DoublyCursor(self, index)
+
+    def concat(self, other):
+        # hook up the prev link at the seam first; the base class does the rest
+        if other is not self and other.head is not None:
+            other.head.prev = self.tail
+        return super().concat(other)
+
+    def splice(self, after_node, other):
+        if other is not self and other.head is not None:
+            after = self.head if after_node is None else after_node.next
+            other.head.prev = after_node
+            if after is not None:
+                after.prev = other.tail
+        return super().splice(after_node, other)
+
+    def split_after(self, node, index=None):
+        if node.next is not None:
+            node.next.prev = None
+        return super().split_after(node, index)
+
+    def sort(self, key=None, reverse=False):
+        if self.length < 2:
+            return
+        try:
+            self._merge_sort(key, reverse)
+        finally:
+            # also after a failed compare, which leaves the nodes reordered
+            before = None
+            for temp in self.iter_nodes():
+                temp.prev = before
+                before = temp
+        if self.debug:
+            self.check_invariants()
+
+    def __reversed__(self):
+        temp = self.tail
+        while temp is not None:
+            yield temp.value
+            temp = temp.prev
+
+    def get(self, index):
+        if index < 0 or index >= self.length:
+            return None
+        # walk from whichever end is closer
+        if index < self.length / 2:
+            temp = self.head
+            for _ in range(index):
+                temp = temp.next
+        else:
+            temp = self.tail
+            for _ in range(self.length - 1, index, -1):
+                temp = temp.prev
+        return temp
+
+    def insert(self, index, value):
+        if index < 0 or index > self.length:
+            return False
+        if index == 0:
+            return self.prepend(value)
+        if index == self.length:
+            return self.append(value)
+        new_node = DoublyNode(value) if self.pool is None else self.pool.acquire(value)
+        before = self.get(index - 1)
+        after = before.next
+        new_node.prev = before
+        new_node.next = after
+        before.next = new_node
+        after.prev = new_node
+        self.length += 1
+        if self.debug:
+            self.check_invariants()
+        return True
+
+    def remove(self, index):
+        if index < 0 or index >= self.length:
+            return None
+        if index == 0:
+            return self.pop_first()
+        if index == self.length - 1:
+            return self.pop()
+        temp = self.get(index)
+        temp.prev.next = temp.next
+        temp.next.prev = temp.prev
+        temp.next = None
+        temp.prev = None
+        self.length -= 1
+        if self.debug:
+            self.check_invariants()
+        return temp
+
+    def reverse(self):
+        temp = self.head
+        self.head = self.tail
+        self.tail = temp
+        while temp is not None:
+            temp.next, temp.prev = temp.prev, temp.next
+            temp = temp.prev
+        if self.debug:
+            self.check_invariants()
+
+
+
+class DoublyCursor(Cursor):
+    # Cursor whose edits also keep the prev links right
+    def insert_after(self, value):
+        ll = self.linked_list
+        if self.node is None:
+            return ll.prepend(value)
+        new_node = DoublyNode(value) if ll.pool is None else ll.pool.acquire(value)
+        after = self.node.next
+        new_node.prev = self.node
+        new_node.next = after
+        self.node.next = new_node
+        if after is None:
+            ll.tail = new_node
+        else:
+            after.prev = new_node
+        ll.length += 1
+        if ll.debug:
+            ll.check_invariants()
+        return True
+
+    def remove_next(self):
+        ll = self.linked_list
+        if self.node is None:
+            return ll.pop_first()
+        removed_node = self.node.next
+        if removed_node is None:
+            return None
+        if removed_node is ll.tail:
+            return ll.pop()
+        self.node.next = removed_node.next
+        removed_node.next.prev = self.node
+        removed_node.next = None
+        removed_node.prev = None
+        ll.length -= 1
+        if ll.debug:
+            ll.check_invariants()
+        return removed_node
+
+
+if __name__ == "__main__":
+    def dll_to_list(dll):
+        forward = list(dll)
+        # the prev chain must mirror the next chain exactly
+        assert list(reversed(dll))[::-1] == forward
+        assert len(dll) == len(forward)
+        return forward
+
+    dll = DoublyLinkedList(1)
+    dll.append(2)
+    dll.extend([3, 4])
+    print("append:", dll_to_list(dll))
+
+    print("pop:", dll.pop().value)
+    print("after pop:", dll_to_list(dll))
+
+    dll.prepend(0)
+    print("prepend:", dll_to_list(dll))
+
+    print("pop_first:", dll.pop_first().value)
+
+    dll.insert(1, 9)
+    print("insert:", dll_to_list(dll))
+
+    print("get from tail side:", dll.get(3).value)
+    print("get from head side:", dll.get(1).value)
+
+    print("remove:", dll.remove(1).value)
+    print("after remove:", dll_to_list(dll))
+
+    dll.reverse()
+    print("reverse:", dll_to_list(dll))
+
+    dll.pop()
+    dll.pop()
+    dll.pop()
+    print("drained:", (dll.head, dll.tail, dll.length, dll.pop()))
+
+    dll = DoublyLinkedList.from_iterable(range(5))
+    print("from_iterable:", dll_to_list(dll))
+
+    dll = DoublyLinkedList.from_iterable([1, 2, 3])
+    cursor = dll.cursor(0)
+    cursor.insert_after(9)
+    cursor.advance(2)
+    removed = cursor.remove_next()
+    cursor.insert_after(4)
+    dll.cursor().remove_next()
+    print("cursor:", (dll_to_list(dll), removed.value, dll.tail.value))
+
+    from NodePool import NodePool
+    pool = NodePool(DoublyNode)
+    dll = DoublyLinkedList.from_iterable(range(4), pool=pool)
+    print("pooled removals:", [dll.pop_value(), dll.pop_first_value(), dll.remove_value(1)])
+    dll.extend([7, 8])
+    print("pooled reuse:", (dll_to_list(dll), pool.hits, pool.size))
+
+
+"""
+    EXPECTED OUTPUT:
+    ----------------
+    append: [1, 2, 3, 4]
+    pop: 4
+    after pop: [1, 2, 3]
+    prepend: [0, 1, 2, 3]
+    pop_first: 0
+    insert: [1, 9, 2, 3]
+    get from tail side: 3
+    get from head side: 9
+    remove: 9
+    after remove: [1, 2, 3]
+    reverse: [3, 2, 1]
+    drained: (None, None, 0, None)
+    from_iterable: [0, 1, 2, 3, 4]
+    cursor: ([9, 2, 4], 3, 4)
+    pooled removals: [3, 0, 2]
+    pooled reuse: ([1, 7, 8], 2, 1)
+
+"""
@@ -1,48 +1,52 @@
-class Node:
-    def __init__(self, value):
-        self.value = value
-        self.next = None
-        
-class LinkedList:
-    def __init__(self, value):
-        new_node = Node(value)
-        self.head = new_node
-        self.length = 1
-
-    def append(self, value):
-        new_node = Node(value)
-        if self.length == 0:
-            self.head = new_node
-        else:
-            current = self.head
-            while current.next is not None:
-                current = current.next
-            current.next = new_node
-        self.length += 1
-    
-    def print_list(self):
-        if self.head is None:
-            print("empty list")
-        else:
-            temp = self.head
-            values = []
-            while temp is not None:
-                values.append(str(temp.value))
-                temp = temp.next
-            print(" -> ".join(values)) 
+import random
+
+from LinkedList import LinkedList as BaseLinkedList
+
+
+class LinkedList(BaseLinkedList):
+    print_sep = " -> "
 
     def binary_to_decimal(self):
-        node_len = self.length
-        if self.head is None:
-            return 0
-        else:
-            temp = self.head
+        # Horner's rule: one pass, no powers of two and no reliance on length
+        decimal = 0
+        temp = self.head
+        while temp is not None:
+            decimal = decimal * 2 + temp.value
+            temp = temp.next
+        return decimal
+
+    def binary_to_decimal_chunked(self):
+        return self.digits_to_int(2)
+
+    def digits_to_int(self, base):
+        # Most significant digit first. Horner above still redoes big-int
+        # arithmetic on the whole running result for every node; for
+        # power-of-two bases (2, 8, 16, ...) we instead fold digits into a
+        # small accumulator and flush it 64 bits at a time into a byte
+        # buffer, which int.from_bytes turns into the result once at the end.
+        if base < 2:
+            raise ValueError("base must be at least 2")
+        bits = base.bit_length() - 1
+        if base != 1 << bits:
             decimal = 0
-            while temp is not None:
-                node_len -= 1
-                decimal += temp.value * (2 ** node_len)
-                temp = temp.next
+            for digit in self:
+                if not 0 <= digit < base:
+                    raise ValueError(f"digit {digit!r} out of range for base {base}")
+                decimal = decimal * base + digit
             return decimal
+        buffer = bytearray()
+        word = 0
+        word_bits = 0
+        for digit in self:
+            if not 0 <= digit < base:
+                raise ValueError(f"digit {digit!r} out of range for base {base}")
+            word = (word << bits) | digit
+            word_bits += bits
+            if word_bits >= 64:
+                word_bits -= 64
+                buffer += (word >> word_bits).to_bytes(8, "big")
+                word &= (1 << word_bits) - 1
+        return (int.from_bytes(buffer, "big") << word_bits) | word
 
 # Test case 1: Binary number 110 = Decimal number 6
 linked_list = LinkedList(1)
@@ -96,8 +100,31 @@ try:
     print("Test case 5 passed, returned: ", result)
 except AssertionError:
     print("Test case 5 failed, returned: ", result)
-    
- 
+
+# Test case 6: chunked and Horner agree on a long bit list
+random.seed(9)
+bits = [random.getrandbits(1) for _ in range(1000)]
+linked_list = LinkedList.from_iterable(bits)
+result = linked_list.binary_to_decimal_chunked()
+try:
+    assert result == linked_list.binary_to_decimal() == int("".join(map(str, bits)), 2)
+    print("Test case 6 passed, returned: ", result.bit_length(), "bits")
+except AssertionError:
+    print("Test case 6 failed, returned: ", result.bit_length(), "bits")
+
+# Test case 7: octal 755 = 493, hex F0A = 3850, decimal 907 = 907
+results = [
+    LinkedList.from_iterable([7, 5, 5]).digits_to_int(8),
+    LinkedList.from_iterable([15, 0, 10]).digits_to_int(16),
+    LinkedList.from_iterable([9, 0, 7]).digits_to_int(10),
+]
+try:
+    assert results == [493, 3850, 907]
+    print("Test case 7 passed, returned: ", results)
+except AssertionError:
+    print("Test case 7 failed, returned: ", results)
+
+
 """
     EXPECTED OUTPUT:
     ----------------
@@ -106,5 +133,7 @@ except AssertionError:
     Test case 3 passed, returned:  0
     Test case 4 passed, returned:  1
     Test case 5 passed, returned:  13
+    Test case 6 passed, returned:  999 bits
+    Test case 7 passed, returned:  [493, 3850, 907]
 """
 
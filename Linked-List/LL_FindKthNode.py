@@ -1,26 +1,6 @@
-class Node:
-    def __init__(self, value):
-        self.value = value
-        self.next = None
-        
-
-class LinkedList:
-    def __init__(self, value):
-        new_node = Node(value)
-        self.head = new_node
-        self.tail = new_node
-
-        
-    def append(self, value):
-        new_node = Node(value)
-        if self.head == None:
-            self.head = new_node
-            self.tail = new_node
-        else:
-            self.tail.next = new_node
-            self.tail = new_node
-        return True
-  
+from LinkedList import LinkedList
+
+
 def find_kth_from_end(linked_list,k):
     slow = linked_list.head
     fast = linked_list.head
@@ -35,6 +15,80 @@ def find_kth_from_end(linked_list,k):
     return slow
 
 
+def _resolve_position(query, length):
+    # index from the front for a query, or None when it falls outside
+    if isinstance(query, float):
+        if not 0.0 <= query <= 1.0:
+            raise ValueError(f"fractional position {query!r} is outside [0, 1]")
+        return min(int(query * length), length - 1) if length else None
+    index = query if query >= 0 else length + query
+    return index if 0 <= index < length else None
+
+
+def select_positions(linked_list, queries, trust_length=True):
+    # Answers many position queries in one traversal. Each query is
+    #   k >= 0     -> k-th node from the front (like get(k))
+    #   -k < 0     -> k-th node from the end (like find_kth_from_end(k))
+    #   0.0 .. 1.0 -> node at that fraction of the list; 0.5 is the node
+    #                 find_middle_node() returns
+    # Returns the matching nodes in query order, None for out-of-range ones.
+    length = getattr(linked_list, "length", None) if trust_length else None
+    if length is None:
+        return _select_staggered(linked_list.head, queries)
+    wanted = {}
+    for query in queries:
+        index = _resolve_position(query, length)
+        if index is not None:
+            wanted[index] = None
+    temp = linked_list.head
+    for index in range(max(wanted, default=-1) + 1):
+        if index in wanted:
+            wanted[index] = temp
+        temp = temp.next
+    return [wanted.get(_resolve_position(query, length)) for query in queries]
+
+
+def _select_staggered(head, queries):
+    # Length unknown: a lead pointer walks the list once while the other
+    # pointers trail behind it. A from-the-end pointer for k starts at the
+    # head once the lead has seen k nodes and then moves in lockstep; a
+    # fractional pointer for q moves up to int(q * seen) as the lead goes.
+    front = {query: None for query in queries if isinstance(query, int) and query >= 0}
+    from_end = {-query: None for query in queries if isinstance(query, int) and query < 0}
+    fractions = {}
+    for query in queries:
+        if isinstance(query, float):
+            if not 0.0 <= query <= 1.0:
+                raise ValueError(f"fractional position {query!r} is outside [0, 1]")
+            fractions[query] = [head, 0]
+    seen = 0
+    lead = head
+    while lead is not None:
+        if seen in front:
+            front[seen] = lead
+        seen += 1
+        for k, trail in from_end.items():
+            if trail is not None:
+                from_end[k] = trail.next
+            elif seen == k:
+                from_end[k] = head
+        for q, pointer in fractions.items():
+            target = min(int(q * seen), seen - 1)
+            while pointer[1] < target:
+                pointer[0] = pointer[0].next
+                pointer[1] += 1
+        lead = lead.next
+    results = []
+    for query in queries:
+        if isinstance(query, float):
+            results.append(fractions[query][0])
+        elif query >= 0:
+            results.append(front[query])
+        else:
+            results.append(from_end[-query])
+    return results
+
+
 # 1,2,3,4,5
 
 my_linked_list = LinkedList(1)
@@ -50,11 +104,19 @@ result = find_kth_from_end(my_linked_list, k)
 print(result.value)  # Output: 4
 
 
+# first, median, 2nd from the end and 90th percentile in one walk
+queries = [0, 0.5, -2, 0.9]
+print([node.value for node in select_positions(my_linked_list, queries)])
+print([node.value for node in select_positions(my_linked_list, queries, trust_length=False)])
+
+
 
 """
     EXPECTED OUTPUT:
     ----------------
     4
+    [1, 3, 4, 5]
+    [1, 3, 4, 5]
     
 """
 
@@ -1,27 +1,7 @@
-class Node:
-    def __init__(self, value):
-        self.value = value
-        self.next = None
-        
-
-class LinkedList:
-    def __init__(self, value):
-        new_node = Node(value)
-        self.head = new_node
-        self.tail = new_node
-
-        
-    def append(self, value):
-        new_node = Node(value)
-        if self.head == None:
-            self.head = new_node
-            self.tail = new_node
-        else:
-            self.tail.next = new_node
-            self.tail = new_node
-        return True
-        
+from LinkedList import LinkedList as BaseLinkedList
 
+
+class LinkedList(BaseLinkedList):
     def find_middle_node(self):
         slow = self.head
         fast = self.head
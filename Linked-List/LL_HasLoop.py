@@ -1,39 +1,70 @@
-class Node:
-    def __init__(self, value):
-        self.value = value
-        self.next = None
-        
-class LinkedList:
-    def __init__(self, value):
-        new_node = Node(value)
-        self.head = new_node
-        self.tail = new_node
-        self.length = 1
-
-    def append(self, value):
-        new_node = Node(value)
-        if self.length == 0:
-            self.head = new_node
-            self.tail = new_node
-        else:
-            self.tail.next = new_node
-            self.tail = new_node
-        self.length += 1
-        return True
+from collections import namedtuple
+
+from LinkedList import LinkedList as BaseLinkedList
+
+# entry: first node on the cycle, length: nodes on the cycle,
+# tail_length: nodes before the entry
+CycleInfo = namedtuple("CycleInfo", ["entry", "length", "tail_length"])
+
+
+class LinkedList(BaseLinkedList):
+    def _cycle_length(self):
+        # Brent's algorithm: the hare moves one step at a time and the
+        # tortoise teleports to it at every power of two, which takes fewer
+        # pointer steps than moving two pointers at speeds 1 and 2.
+        # Returns the cycle length, or 0 when the chain ends.
+        if self.head is None:
+            return 0
+        power = length = 1
+        tortoise = self.head
+        hare = self.head.next
+        while hare is not tortoise:
+            if hare is None:
+                return 0
+            if power == length:
+                tortoise = hare
+                power *= 2
+                length = 0
+            hare = hare.next
+            length += 1
+        return length
 
     def has_loop(self):
-        slow = self.head
-        fast = self.head
-        while fast and fast.next:
-            slow = slow.next
-            fast = fast.next.next
-            if slow == fast:
-                return True
-        return False
-    
-    
-    
-    
+        return self._cycle_length() > 0
+
+    def find_cycle(self):
+        length = self._cycle_length()
+        if length == 0:
+            return None
+        # a pointer `length` steps ahead meets the trailing one at the entry
+        ahead = self.head
+        for _ in range(length):
+            ahead = ahead.next
+        behind = self.head
+        tail_length = 0
+        while behind is not ahead:
+            behind = behind.next
+            ahead = ahead.next
+            tail_length += 1
+        return CycleInfo(behind, length, tail_length)
+
+    def break_cycle(self):
+        # cuts the link that closes the cycle and repairs tail and length
+        info = self.find_cycle()
+        if info is None:
+            return False
+        last = info.entry
+        for _ in range(info.length - 1):
+            last = last.next
+        last.next = None
+        self.tail = last
+        self.length = info.tail_length + info.length
+        self._reset_finger()
+        if self.debug:
+            self.check_invariants()
+        return True
+
+
 my_linked_list_1 = LinkedList(1)
 my_linked_list_1.append(2)
 my_linked_list_1.append(3)
@@ -52,10 +83,23 @@ print(my_linked_list_2.has_loop() ) # Returns False
 
 
 
+# 1 -> 2 -> 3 -> 4 -> 5 -> back to 3
+my_linked_list_3 = LinkedList.from_iterable([1, 2, 3, 4, 5])
+my_linked_list_3.tail.next = my_linked_list_3.get(2)
+info = my_linked_list_3.find_cycle()
+print(info.entry.value, info.length, info.tail_length)  # Returns 3 3 2
+print(my_linked_list_3.break_cycle(), list(my_linked_list_3), my_linked_list_3.tail.value)
+print(my_linked_list_3.find_cycle())  # Returns None
+
+
+
 """
     EXPECTED OUTPUT:
     ----------------
     True
     False
+    3 3 2
+    True [1, 2, 3, 4, 5] 5
+    None
     
 """
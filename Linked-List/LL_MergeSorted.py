@@ -0,0 +1,124 @@
+import heapq
+
+from LinkedList import LinkedList
+from DoublyLinkedList import DoublyLinkedList
+
+
+def merge_sorted(lists, key=None):
+    # Merges already-sorted LinkedLists into one new list of the first
+    # list's type in O(N log k): a heap holds the current front node of
+    # each list, and nodes are relinked rather than copied, so every input
+    # list is left empty. Equal keys keep the order of `lists`, then of
+    # each list.
+    #
+    # If key() or a comparison raises, no node is lost: each input gets its
+    # unmerged nodes back, and the nodes merged so far go in front of the
+    # first list's (they sort before everything left), so every input is
+    # still sorted but the nodes may have moved between lists.
+    lists = list(lists)
+    if not lists:
+        return LinkedList()
+    merged = type(lists[0])(pool=lists[0].pool)
+    doubly = isinstance(merged, DoublyLinkedList)
+    if doubly and not all(isinstance(linked_list, DoublyLinkedList) for linked_list in lists):
+        raise TypeError("cannot merge singly linked lists into a DoublyLinkedList")
+    heap = []
+    for list_index, linked_list in enumerate(lists):
+        node = linked_list.head
+        if node is not None:
+            heap.append((node.value if key is None else key(node.value), list_index, node))
+    heapq.heapify(heap)
+    for linked_list in lists:
+        merged.length += linked_list.length
+        linked_list.make_empty()
+
+    tail = None
+    try:
+        while heap:
+            _, list_index, node = heap[0]
+            after = node.next
+            if after is not None:
+                item = (after.value if key is None else key(after.value), list_index, after)
+            if tail is None:
+                merged.head = node
+            else:
+                tail.next = node
+            if doubly:
+                node.prev = tail
+            tail = node
+            if after is None:
+                heapq.heappop(heap)
+            else:
+                heapq.heapreplace(heap, item)
+    except BaseException:
+        # a failed heap operation still leaves every entry in `heap`
+        fronts = {list_index: node for _, list_index, node in heap}
+        if tail is not None:
+            tail.next = fronts.get(0)
+            fronts[0] = merged.head
+        for list_index, linked_list in enumerate(lists):
+            last = None
+            node = linked_list.head = fronts.get(list_index)
+            while node is not None:
+                if doubly:
+                    node.prev = last
+                last = node
+                node = node.next
+                linked_list.length += 1
+            linked_list.tail = last
+        raise
+    if tail is not None:
+        tail.next = None
+    merged.tail = tail
+    return merged
+
+
+def iter_merge_sorted(lists, key=None):
+    # Lazy variant: yields the merged values one at a time and leaves the
+    # input lists untouched.
+    return heapq.merge(*lists, key=key)
+
+
+if __name__ == "__main__":
+    shards = [
+        LinkedList.from_iterable([1, 4, 7, 10]),
+        LinkedList.from_iterable([2, 5, 8]),
+        LinkedList(),
+        LinkedList.from_iterable([0, 3, 6, 9, 12]),
+    ]
+    print(list(iter_merge_sorted(shards)))
+
+    merged = merge_sorted(shards)
+    print(list(merged), merged.length, merged.tail.value)
+    print([shard.length for shard in shards])
+
+    # key and stability: equal keys come out in shard order
+    by_name = merge_sorted([
+        LinkedList.from_iterable([("a", 1), ("c", 1)]),
+        LinkedList.from_iterable([("a", 2), ("b", 2)]),
+    ], key=lambda record: record[0])
+    print(list(by_name))
+
+    # a comparison that raises keeps every node, each list still sorted
+    shards = [LinkedList.from_iterable([1, 3]), LinkedList.from_iterable([2, None])]
+    try:
+        merge_sorted(shards)
+    except TypeError:
+        print([(list(shard), shard.length) for shard in shards])
+
+    # DoublyLinkedList shards merge into a DoublyLinkedList
+    merged = merge_sorted([DoublyLinkedList.from_iterable([1, 3]), DoublyLinkedList.from_iterable([2])])
+    print(type(merged).__name__, list(merged), merged.tail.prev.value, merged.check_invariants())
+
+
+"""
+    EXPECTED OUTPUT:
+    ----------------
+    [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 12]
+    [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 12] 12 12
+    [0, 0, 0, 0]
+    [('a', 1), ('a', 2), ('b', 2), ('c', 1)]
+    [([1, 2, 3], 3), ([None], 1)]
+    DoublyLinkedList [1, 2, 3] 2 True
+
+"""
@@ -1,36 +1,7 @@
-class Node:
-    def __init__(self, value):
-        self.value = value
-        self.next = None
-        
-class LinkedList:
-    def __init__(self, value):
-        new_node = Node(value)
-        self.head = new_node
-        self.length = 1
-
-    def append(self, value):
-        new_node = Node(value)
-        if self.length == 0:
-            self.head = new_node
-        else:
-            current_node = self.head
-            while current_node.next is not None:
-                current_node = current_node.next
-            current_node.next = new_node
-        self.length += 1 
-    
-    def print_list(self):
-        temp = self.head
-        while temp is not None:
-            print(temp.value)
-            temp = temp.next    
-            
-    def make_empty(self):
-        self.head = None
-        self.tail = None
-        self.length = 0
-        
+from LinkedList import LinkedList as BaseLinkedList
+
+
+class LinkedList(BaseLinkedList):
 #   +===================================================+
 #   |               WRITE YOUR CODE HERE                |
 #   | Description:                                      |
@@ -55,41 +26,68 @@ class LinkedList:
 
 
     def partition_list(self,x):
+        # Relinks the existing nodes instead of copying them, so no Node is
+        # allocated. dummy1/dummy2 hold the first node of each chain and
+        # prev1/prev2 the last; nodes keep their relative order (stable).
         if self.head is None:
-            return 
-        else: 
-            dummy1, dummy2  = None, None
-            prev1 =  dummy1
-            prev2 = dummy2
-            current = self.head
-            while current:
-                if current.value < x:
-                    if prev1:
-                        prev1.next = Node(current.value)
-                        prev1 = prev1.next
-                    else:
-                        dummy1 = Node(current.value)
-                        prev1 = dummy1
+            return
+        dummy1, dummy2 = None, None
+        prev1, prev2 = None, None
+        current = self.head
+        while current:
+            if current.value < x:
+                if prev1:
+                    prev1.next = current
                 else:
-                    if prev2:
-                        prev2.next = Node(current.value)
-                        prev2 = prev2.next
-                    else:
-                        dummy2 = Node(current.value)
-                        prev2 = dummy2
-                current = current.next
-            if dummy1 and dummy2:
-                node_len = self.length
-                self.make_empty()
-                # print(linkedlist_to_list(dummy1))
-                # print(linkedlist_to_list(dummy2))
-                prev1.next = dummy2
-                self.head = dummy1
-                self.length = node_len
-
-
-    
+                    dummy1 = current
+                prev1 = current
+            else:
+                if prev2:
+                    prev2.next = current
+                else:
+                    dummy2 = current
+                prev2 = current
+            current = current.next
+        if prev2:
+            prev2.next = None
+        if prev1:
+            prev1.next = dummy2
+            self.head = dummy1
+        else:
+            self.head = dummy2
+        self.tail = prev2 if prev2 else prev1
+        self._reset_finger()
+        if self.debug:
+            self.check_invariants()
 
+    def partition_by(self, key, buckets):
+        # k-way version of partition_list: key(value) picks a bucket in
+        # range(buckets) and every node is moved, in order, onto that
+        # bucket's list. Returns the bucket lists and leaves this list empty.
+        # Every key is computed and checked before any node is moved, so a
+        # bad bucket or an exception from key leaves the list untouched.
+        indexes = []
+        for value in self:
+            index = key(value)
+            if not 0 <= index < buckets:
+                raise ValueError(f"key returned {index!r}, expected 0..{buckets - 1}")
+            indexes.append(index)
+        parts = [type(self)(pool=self.pool) for _ in range(buckets)]
+        current = self.head
+        for index in indexes:
+            part = parts[index]
+            if part.tail:
+                part.tail.next = current
+            else:
+                part.head = current
+            part.tail = current
+            part.length += 1
+            current = current.next
+        for part in parts:
+            if part.tail:
+                part.tail.next = None
+        self.make_empty()
+        return parts
 
 
 #  +=====================================================+
@@ -245,6 +243,46 @@ def test_partition_list():
     print(f"{test_cases_passed} out of 7 tests passed.")
 
 
+# Function to test partition_by
+def test_partition_by():
+    print("Test: partition_by into 3 buckets by value % 3")
+    ll = LinkedList.from_iterable(range(10))
+    nodes_before = list(ll.iter_nodes())
+    parts = ll.partition_by(lambda value: value % 3, 3)
+    result = [linkedlist_to_list(part.head) for part in parts]
+    print("After:", result)
+    moved = [node for part in parts for node in part.iter_nodes()]
+    tails_ok = all(part.tail is None or part.tail.next is None for part in parts)
+    if (result == [[0, 3, 6, 9], [1, 4, 7], [2, 5, 8]]
+            and [part.length for part in parts] == [4, 3, 3]
+            and set(map(id, moved)) == set(map(id, nodes_before))
+            and tails_ok and ll.length == 0 and ll.head is None):
+        print("PASS")
+    else:
+        print("FAIL")
+    print("-----------------------")
+
+    print("Test: partition_by with a key that raises")
+    ll = LinkedList.from_iterable(range(5))
+
+    def bad_key(value):
+        if value == 3:
+            raise KeyError(value)
+        return value % 2
+
+    try:
+        ll.partition_by(bad_key, 2)
+        print("FAIL")
+    except KeyError:
+        print("After:", linkedlist_to_list(ll.head), ll.length)
+        if ll.check_invariants() and linkedlist_to_list(ll.head) == [0, 1, 2, 3, 4]:
+            print("PASS")
+        else:
+            print("FAIL")
+    print("-----------------------")
+
+
 # Run the test function
 test_partition_list()
+test_partition_by()
       
\ No newline at end of file
@@ -1,72 +1,109 @@
-class Node:
-    def __init__(self, value):
-        self.value = value
-        self.next = None
-        
-class LinkedList:
-    def __init__(self, value):
-        new_node = Node(value)
-        self.head = new_node
-        self.length = 1
-
-    def append(self, value):
-        new_node = Node(value)
-        if self.length == 0:
-            self.head = new_node
-        else:
-            current = self.head
-            while current.next is not None:
-                current = current.next
-            current.next = new_node
-        self.length += 1
-    
-    def print_list(self):
-        if self.head is None:
-            print("empty list")
+import hashlib
+import math
+import sys
+from collections import namedtuple
+
+from LinkedList import LinkedList as BaseLinkedList
+
+DedupStats = namedtuple("DedupStats", ["nodes_removed", "memory_bytes"])
+
+
+class BloomFilter:
+    # Fixed-size bit array sized for `expected_items` at the requested false
+    # positive rate; k bit positions per value come from double hashing.
+    def __init__(self, expected_items, false_positive_rate):
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("false_positive_rate must be between 0 and 1")
+        expected_items = max(expected_items, 1)
+        bit_count = math.ceil(-expected_items * math.log(false_positive_rate) / math.log(2) ** 2)
+        self.bit_count = max(bit_count, 8)
+        self.hash_count = max(1, round(self.bit_count / expected_items * math.log(2)))
+        self.bits = bytearray((self.bit_count + 7) // 8)
+
+    def add(self, value):
+        # sets the value's bits and returns True if they were all set
+        # already, i.e. the value was (probably) added before
+        # h2 comes from the value's repr rather than from h1, so values whose
+        # hash() collides (-1 and -2 in CPython) still get different bits;
+        # equal values with different reprs (1 and 1.0) count as distinct
+        h1 = hash(value)
+        digest = hashlib.blake2b(repr(value).encode(), digest_size=8, person=b"bloom").digest()
+        h2 = int.from_bytes(digest, "little") | 1
+        bits = self.bits
+        seen = True
+        for i in range(self.hash_count):
+            position = (h1 + i * h2) % self.bit_count
+            mask = 1 << (position & 7)
+            byte = position >> 3
+            if not bits[byte] & mask:
+                seen = False
+                bits[byte] |= mask
+        return seen
+
+
+class LinkedList(BaseLinkedList):
+    print_sep = " -> "
+
+    def remove_duplicates(self, strategy="hash", false_positive_rate=0.01, expected_items=None):
+        # strategy:
+        #   "hash"   - exact; remembers every distinct value in a set
+        #   "sorted" - exact for sorted lists (drops adjacent repeats only),
+        #              O(1) extra memory
+        #   "bloom"  - approximate; a Bloom filter sized for expected_items
+        #              (default: length). Never keeps a duplicate, but may drop
+        #              a unique value with probability ~false_positive_rate.
+        # Returns DedupStats(nodes_removed, memory_bytes) where memory_bytes is
+        # the size of the structure used to remember values.
+        if strategy == "hash":
+            values = set()
+
+            def is_duplicate(value):
+                if value in values:
+                    return True
+                values.add(value)
+                return False
+
+            memory = lambda: sys.getsizeof(values)
+        elif strategy == "bloom":
+            if expected_items is None:
+                expected_items = self.length
+            bloom = BloomFilter(expected_items, false_positive_rate)
+            is_duplicate = bloom.add
+            memory = lambda: sys.getsizeof(bloom.bits)
+        elif strategy == "sorted":
+            is_duplicate = None
+            memory = lambda: 0
         else:
-            temp = self.head
-            values = []
-            # while temp is not None:
-            while temp:
-                values.append(str(temp.value))
-                temp = temp.next
-            print(" -> ".join(values))
-
-    def remove_duplicates(self):
+            raise ValueError(f"unknown strategy {strategy!r}")
+
+        removed = 0
+        previous = None
         current = self.head
-        prev = self.head
-        my_list = set()
-        set_len = len(my_list)
         while current:
-            my_list.add(current.value)
-            if len(my_list) > set_len:
-                prev = current
-                current = current.next
-                set_len = len(my_list)
+            after = current.next
+            if is_duplicate is None:
+                duplicate = previous is not None and previous.value == current.value
             else:
-                prev.next = current.next
+                duplicate = is_duplicate(current.value)
+            if duplicate:
+                previous.next = after
                 current.next = None
-                current = prev.next
-                self.length -=1
+                removed += 1
+            else:
+                previous = current
+            current = after
+        self.length -= removed
+        self.tail = previous
+        self._reset_finger()
+        if self.debug:
+            self.check_invariants()
+        return DedupStats(removed, memory())
 
-    def remove_duplicates(self):
-            values = set()
-            previous = None
-            current = self.head
-            while current:
-                if current.value in values:
-                    previous.next = current.next
-                    self.length -= 1
-                else:
-                    values.add(current.value)
-                    previous = current
-                current = current.next
-
-
-def test_remove_duplicates(linked_list, expected_values):
+
+def test_remove_duplicates(linked_list, expected_values, strategy="hash"):
     print("Before: ", end="")
     linked_list.print_list()
-    linked_list.remove_duplicates()
+    linked_list.remove_duplicates(strategy)
     print("After:  ", end="")
     linked_list.print_list()
 
@@ -132,3 +169,23 @@ ll = LinkedList(None)
 ll.head = None  # Directly setting the head to None
 ll.length = 0   # Adjusting the length to reflect an empty list
 test_remove_duplicates(ll, [])
+
+# Test 8: Sorted list, O(1)-memory strategy
+ll = LinkedList.from_iterable([1, 1, 2, 3, 3, 3, 4])
+test_remove_duplicates(ll, [1, 2, 3, 4], strategy="sorted")
+
+# Test 9: Bloom filter strategy
+ll = LinkedList.from_iterable([5, 1, 5, 2, 1, 3])
+test_remove_duplicates(ll, [5, 1, 2, 3], strategy="bloom")
+
+# Test 10: Values whose hash() collides are still told apart
+ll = LinkedList.from_iterable([-1, -2, -1])
+ll.remove_duplicates("bloom", false_positive_rate=1e-9)
+print(list(ll), ll.length)
+
+# Test 11: Stats for each strategy on 10,000 values with 9,000 repeats
+for strategy in ("hash", "sorted", "bloom"):
+    ll = LinkedList.from_iterable(sorted(list(range(1000)) * 10))
+    stats = ll.remove_duplicates(strategy)
+    print(f"{strategy:>6}: removed {stats.nodes_removed}, memory {stats.memory_bytes} bytes, "
+          f"length {ll.length}, tail {ll.tail.value}")
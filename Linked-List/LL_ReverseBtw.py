@@ -1,36 +1,8 @@
-class Node:
-    def __init__(self, value):
-        self.value = value
-        self.next = None
-        
-class LinkedList:
-    def __init__(self, value):
-        new_node = Node(value)
-        self.head = new_node
-        self.length = 1
-
-    def append(self, value):
-        new_node = Node(value)
-        if self.length == 0:
-            self.head = new_node
-        else:
-            current = self.head
-            while current.next is not None:
-                current = current.next
-            current.next = new_node
-        self.length += 1
-        return True
-    
-    def print_list(self):
-        temp = self.head
-        while temp is not None:
-            print(temp.value)
-            temp = temp.next    
-            
-    def make_empty(self):
-        self.head = None
-        self.length = 0
+from Node import Node
+from LinkedList import LinkedList as BaseLinkedList
+
 
+class LinkedList(BaseLinkedList):
     def reverse_between(self, start_index, end_index):
         # 1. Edge Case: If list has only one node or none, exit.
         if self.length <= 1:
@@ -68,7 +40,62 @@ class LinkedList:
     
         # 7. Update list head if 'start_index' was 0.
         self.head = dummy_node.next
-    
+
+        # 8. The node that started the range is now its last node, so it
+        # becomes the tail when the range ran to the end of the list.
+        if end_index == self.length - 1:
+            self.tail = current_node
+        self._reset_finger()
+        if self.debug:
+            self.check_invariants()
+
+    def reverse_ranges(self, ranges):
+        # Applies many reverse_between(start, end) calls in one walk: ranges
+        # are sorted by start and must not overlap, and 'previous_node' keeps
+        # moving forward from one range to the next instead of restarting at
+        # the head, so the total cost is O(n) rather than O(k * n).
+        ranges = sorted(ranges)
+        last_end = -1
+        for start_index, end_index in ranges:
+            if start_index <= last_end or start_index > end_index or end_index >= self.length:
+                raise ValueError(f"bad or overlapping range ({start_index}, {end_index})")
+            last_end = end_index
+        if self.length <= 1:
+            return
+
+        dummy_node = Node(0)
+        dummy_node.next = self.head
+        previous_node = dummy_node
+        position = -1
+        for start_index, end_index in ranges:
+            for _ in range(start_index - 1 - position):
+                previous_node = previous_node.next
+            current_node = previous_node.next
+            for _ in range(end_index - start_index):
+                node_to_move = current_node.next
+                current_node.next = node_to_move.next
+                node_to_move.next = previous_node.next
+                previous_node.next = node_to_move
+            if end_index == self.length - 1:
+                self.tail = current_node
+            # the range's first node is now its last; continue from there
+            previous_node = current_node
+            position = end_index
+        self.head = dummy_node.next
+        self._reset_finger()
+        if self.debug:
+            self.check_invariants()
+
+    def reverse_k_group(self, k):
+        # Reverses every full group of k nodes; a shorter group left at the
+        # end keeps its order. k = 2 is the pairwise swap.
+        if k <= 1:
+            return
+        self.reverse_ranges(
+            (start_index, start_index + k - 1)
+            for start_index in range(0, self.length - k + 1, k)
+        )
+
 
 
 linked_list = LinkedList(1)
@@ -102,6 +129,18 @@ empty_list.reverse_between(0, 0)
 print("Reversed empty linked list: ")
 empty_list.print_list()
 
+# Reverse several sublists in one pass
+ranges_list = LinkedList.from_iterable(range(1, 9))
+ranges_list.reverse_ranges([(5, 7), (0, 2)])
+print("Reversed ranges (0, 2) and (5, 7): ")
+print(list(ranges_list), ranges_list.tail.value)
+
+# Reverse in groups of 3; the trailing group of 2 stays as is
+groups_list = LinkedList.from_iterable(range(1, 9))
+groups_list.reverse_k_group(3)
+print("Reversed in groups of 3: ")
+print(list(groups_list), groups_list.tail.value)
+
 
 print("completed the code..")
 """
@@ -133,5 +172,9 @@ print("completed the code..")
     1
     Reversed empty linked list: 
     None
+    Reversed ranges (0, 2) and (5, 7): 
+    [3, 2, 1, 4, 5, 8, 7, 6] 6
+    Reversed in groups of 3: 
+    [3, 2, 1, 6, 5, 4, 7, 8] 8
     
 """
@@ -1,23 +1,221 @@
-class Node:
-    def __init__(self, value):
-        self.value = value
-        self.next = None
+import array
+import os
+import struct
+import sys
+from itertools import islice
+
+from Node import Node
+
+# default for __init__ so that LinkedList() builds an empty list while
+# LinkedList(None) still holds a single None value
+_EMPTY = object()
+
+# dump()/load() file layout: this header (magic, array typecode, item size,
+# length) followed by the values packed as array.array(typecode) items in
+# little-endian byte order. The header is 16 bytes so the values start
+# 8-byte aligned.
+_DUMP_MAGIC = b"LLB1"
+_DUMP_HEADER = struct.Struct("<4scBxxQ")
+_DUMP_CHUNK = 1 << 16
+
+# sort() tops natural runs shorter than this up by insertion before merging
+_SORT_MIN_RUN = 16
+
+
+def _read_dump_header(data):
+    # returns (typecode, length) or raises ValueError
+    if len(data) < _DUMP_HEADER.size:
+        raise ValueError("file is too short for a LinkedList dump header")
+    magic, typecode, itemsize, length = _DUMP_HEADER.unpack_from(data)
+    if magic != _DUMP_MAGIC:
+        raise ValueError("not a LinkedList dump")
+    typecode = typecode.decode()
+    if array.array(typecode).itemsize != itemsize:
+        raise ValueError(f"typecode {typecode!r} has a different item size on this platform")
+    return typecode, length
+
 
 class LinkedList:
-    def __init__(self,value):
-        new_node = Node(value)
-        self.head = new_node
-        self.tail = new_node
-        self.length = 1
+    # set to True (on the class or one instance) to re-check head/tail/length
+    # after every mutation; see check_invariants()
+    debug = False
+
+    # "finger": the last node get() reached and its index. get() resumes
+    # from it when the target is at or after it, so sequential get/set_value/
+    # insert/remove loops are O(n) overall instead of O(n^2). Anything that
+    # moves nodes before the finger must call _reset_finger().
+    _finger_index = -1
+    _finger_node = None
+
+    # optional NodePool: new nodes come from it, and pop_value,
+    # pop_first_value and remove_value give the nodes they detach back to
+    # it. pop, pop_first and remove still hand the node to the caller.
+    pool = None
+    _node_class = Node
+
+    # what print_list() writes between values; " -> " prints the list on one
+    # line as "a -> b -> c" (or "empty list")
+    print_sep = "\n"
+
+    def __init__(self, value=_EMPTY, pool=None):
+        self.head = None
+        self.tail = None
+        self.length = 0
+        if pool is not None:
+            if not issubclass(pool.node_class, self._node_class):
+                raise TypeError(f"{type(self).__name__} needs a pool of {self._node_class.__name__}")
+            self.pool = pool
+        if value is not _EMPTY:
+            self.append(value)
+
+    @classmethod
+    def from_iterable(cls, iterable, pool=None):
+        new_list = cls(pool=pool)
+        new_list.extend(iterable)
+        return new_list
+
+    def extend(self, iterable):
+        # build the new nodes as a chain of their own, then attach it in O(1)
+        # like concat, so an iterable that raises leaves the list unchanged
+        if iterable is self:
+            iterable = list(self)
+        make_node = Node if self.pool is None else self.pool.acquire
+        head = tail = None
+        count = 0
+        for value in iterable:
+            new_node = make_node(value)
+            if tail is None:
+                head = new_node
+            else:
+                tail.next = new_node
+            tail = new_node
+            count += 1
+        if head is not None:
+            if self.tail is None:
+                self.head = head
+            else:
+                self.tail.next = head
+            self.tail = tail
+            self.length += count
+        if self.debug:
+            self.check_invariants()
+        return True
+
+    def check_invariants(self):
+        # walk at most length + 1 nodes so a cycle cannot hang the check
+        count = 0
+        last = None
+        temp = self.head
+        while temp is not None and count <= self.length:
+            if count == self._finger_index:
+                assert temp is self._finger_node, "finger points at the wrong node"
+            last = temp
+            temp = temp.next
+            count += 1
+        assert count == self.length, f"length is {self.length} but chain has {count}+ nodes"
+        assert self._finger_index < self.length, "finger is past the end"
+        assert last is self.tail, "tail is not the last node of the chain"
+        assert self.tail is None or self.tail.next is None, "tail.next is not None"
+        return True
+
+    def make_empty(self):
+        self.head = None
+        self.tail = None
+        self.length = 0
+        self._reset_finger()
+
+    def _reset_finger(self):
+        self._finger_index = -1
+        self._finger_node = None
+
+    def _recycle(self, node):
+        value = node.value
+        if self.pool is not None:
+            self.pool.release(node)
+        return value
+
+    def cursor(self, index=-1):
+        return Cursor(self, index)
+
+    def __len__(self):
+        return self.length
 
-    def print_list(self):
+    def __iter__(self):
         temp = self.head
         while temp is not None:
-            print(temp.value)
+            yield temp.value
             temp = temp.next
+
+    def iter_nodes(self):
+        temp = self.head
+        while temp is not None:
+            yield temp
+            temp = temp.next
+
+    def print_list(self, file=None, sep=None):
+        # one buffered writelines() over the iterator instead of a print()
+        # call per node
+        if file is None:
+            file = sys.stdout
+        if sep is None:
+            sep = self.print_sep
+        if sep == "\n":
+            file.writelines(str(value) + "\n" for value in self)
+            return
+        if self.head is None:
+            file.write("empty list\n")
+            return
+        values = iter(self)
+        file.write(str(next(values)))
+        file.writelines(sep + str(value) for value in values)
+        file.write("\n")
+
+    def dump(self, path, typecode="q"):
+        # Every value must fit array.array(typecode) ("q" for ints, "d" for
+        # floats, ...); values are packed in chunks so no full copy is made.
+        # The dump goes to `path`.tmp, which replaces `path` only once every
+        # value is written, so a value that does not fit leaves any earlier
+        # dump at `path` untouched.
+        itemsize = array.array(typecode).itemsize
+        temp_path = f"{path}.tmp"
+        try:
+            with open(temp_path, "wb") as file:
+                file.write(_DUMP_HEADER.pack(_DUMP_MAGIC, typecode.encode(), itemsize, self.length))
+                values = iter(self)
+                while True:
+                    chunk = array.array(typecode, islice(values, _DUMP_CHUNK))
+                    if not chunk:
+                        break
+                    if sys.byteorder == "big":
+                        chunk.byteswap()
+                    chunk.tofile(file)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+        return True
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as file:
+            typecode, remaining = _read_dump_header(file.read(_DUMP_HEADER.size))
+            new_list = cls()
+            while remaining:
+                chunk = array.array(typecode)
+                size = min(remaining, _DUMP_CHUNK) * chunk.itemsize
+                data = file.read(size)
+                if len(data) < size:
+                    raise ValueError("LinkedList dump is truncated")
+                chunk.frombytes(data)
+                if sys.byteorder == "big":
+                    chunk.byteswap()
+                new_list.extend(chunk)
+                remaining -= len(chunk)
+        return new_list
     
     def append(self, value):
-        new_node = Node(value)
+        new_node = Node(value) if self.pool is None else self.pool.acquire(value)
         if self.head is  None:
             self.head = new_node
             self.tail = new_node
@@ -25,28 +223,10 @@ class LinkedList:
             self.tail.next = new_node
             self.tail = new_node
         self.length += 1
+        if self.debug:
+            self.check_invariants()
         return True
     
-    def pop(self):
-        if self.head is None:
-            return None
-        elif self.head.next is None:
-            popped_value = self.head.value
-            self.head = None
-            self.tail = None
-            self.length -= 1
-            return popped_value
-        else:
-            current = self.head
-            while current is not None:
-                if current.next is None:
-                    self.tail = last
-                    self.tail.next = None
-                    self.length -= 1
-                    return current.value
-                last = current
-                current = current.next
-    
     def pop(self):
         if self.length == 0:
             return None
@@ -61,10 +241,14 @@ class LinkedList:
         if self.length == 0:
             self.head = None
             self.tail = None
+        if self._finger_index >= self.length:
+            self._reset_finger()
+        if self.debug:
+            self.check_invariants()
         return temp
         
     def prepend(self, value):
-        new_node = Node(value)
+        new_node = Node(value) if self.pool is None else self.pool.acquire(value)
         if self.length == 0:
             self.head = new_node
             self.tail = new_node
@@ -72,6 +256,9 @@ class LinkedList:
             new_node.next = self.head
             self.head = new_node
         self.length += 1
+        self._reset_finger()
+        if self.debug:
+            self.check_invariants()
         return True
     
     def pop_first(self):
@@ -83,14 +270,46 @@ class LinkedList:
         self.length -= 1
         if self.length == 0:
             self.tail = None
+        self._reset_finger()
+        if self.debug:
+            self.check_invariants()
         return temp
     
+    # pop(), pop_first() and remove() return the detached node; these
+    # return its value and give the node back to the pool, if there is one.
+    # They raise IndexError when there is nothing to remove, as None may
+    # be a stored value.
+    def pop_value(self):
+        node = self.pop()
+        if node is None:
+            raise IndexError("pop from an empty list")
+        return self._recycle(node)
+
+    def pop_first_value(self):
+        node = self.pop_first()
+        if node is None:
+            raise IndexError("pop from an empty list")
+        return self._recycle(node)
+
+    def remove_value(self, index):
+        node = self.remove(index)
+        if node is None:
+            raise IndexError("remove index out of range")
+        return self._recycle(node)
+
     def get(self,index):
         if index < 0 or index >= self.length:
             return None
-        temp = self.head
-        for _ in range(index):
+        if self._finger_node is not None and self._finger_index <= index:
+            temp = self._finger_node
+            steps = index - self._finger_index
+        else:
+            temp = self.head
+            steps = index
+        for _ in range(steps):
             temp = temp.next
+        self._finger_index = index
+        self._finger_node = temp
         return temp
     
     def set_value(self,index,value):
@@ -107,11 +326,14 @@ class LinkedList:
             return self.prepend(value)
         if index == self.length:
             return self.append(value)
-        new_node = Node(value)
+        new_node = Node(value) if self.pool is None else self.pool.acquire(value)
+        # the finger ends up on prev, which the insert does not move
         prev = self.get(index - 1)
         new_node.next = prev.next
         prev.next = new_node
         self.length += 1
+        if self.debug:
+            self.check_invariants()
         return True
     
     def remove(self, index):
@@ -121,11 +343,14 @@ class LinkedList:
             return self.pop_first()
         if index == self.length - 1:
             return self.pop()
+        # the finger ends up on prev, which the removal does not move
         prev = self.get(index - 1)
         removed_node  = prev.next
         prev.next = removed_node.next
         removed_node.next = None
         self.length -=1
+        if self.debug:
+            self.check_invariants()
         return removed_node
     
     def reverse(self):
@@ -140,23 +365,439 @@ class LinkedList:
             after = temp.next
             temp.next = before
             before = temp
-            temp = after 
-    
-my_linked_list = LinkedList(2)
-
-# my_linked_list.append(2)
-# my_linked_list.append(3)
-# # print(my_linked_list.tail.next)
-# my_linked_list.print_list()
-# print()
-# my_linked_list.pop()
-# my_linked_list.pop()
-# my_linked_list.pop()
-# my_linked_list.pop()
-# my_linked_list.pop()
-# # my_linked_list.pop()
-# my_linked_list.print_list()
-# print(my_linked_list.length)
-my_linked_list.prepend(1)
-my_linked_list.print_list()
-print(my_linked_list.length)
\ No newline at end of file
+            temp = after
+        self._reset_finger()
+        if self.debug:
+            self.check_invariants()
+
+    def concat(self, other):
+        # moves every node of `other` onto the end of this list in O(1)
+        if other is self:
+            raise ValueError("cannot concat a list onto itself")
+        if other.head is not None:
+            if self.tail is None:
+                self.head = other.head
+            else:
+                self.tail.next = other.head
+            self.tail = other.tail
+            self.length += other.length
+            other.make_empty()
+        if self.debug:
+            self.check_invariants()
+        return True
+
+    def splice(self, after_node, other):
+        # moves every node of `other` in right after `after_node` (or in
+        # front of the head when after_node is None) in O(1)
+        if other is self:
+            raise ValueError("cannot splice a list into itself")
+        if other.head is not None:
+            if after_node is None:
+                other.tail.next = self.head
+                self.head = other.head
+            else:
+                other.tail.next = after_node.next
+                after_node.next = other.head
+            if after_node is self.tail:
+                self.tail = other.tail
+            self.length += other.length
+            other.make_empty()
+            self._reset_finger()
+        if self.debug:
+            self.check_invariants()
+        return True
+
+    def split_after(self, node, index=None):
+        # Detaches everything after `node` into a new list of the same type
+        # and returns it. With the node's index the new length is O(1) to
+        # work out; without it the detached nodes are counted.
+        new_list = type(self)(pool=self.pool)
+        if node.next is not None:
+            new_list.head = node.next
+            new_list.tail = self.tail
+            if index is None:
+                new_list.length = sum(1 for _ in new_list.iter_nodes())
+            else:
+                new_list.length = self.length - index - 1
+            node.next = None
+            self.tail = node
+            self.length -= new_list.length
+            if self._finger_index >= self.length:
+                self._reset_finger()
+        if self.debug:
+            self.check_invariants()
+            new_list.check_invariants()
+        return new_list
+
+    def split_at(self, index):
+        # keeps nodes [0, index) and returns nodes [index, length) as a new
+        # list; O(index) to find the split point
+        if index < 0 or index > self.length:
+            return None
+        if index == 0:
+            new_list = type(self)(pool=self.pool)
+            new_list.concat(self)
+            return new_list
+        return self.split_after(self.get(index - 1), index - 1)
+
+    def sort(self, key=None, reverse=False):
+        # Stable, in-place merge sort that relinks nodes instead of copying
+        # them; key() is called once per node. It works from the natural
+        # runs already in the data: sorted or reversed input takes one
+        # linear pass, and nearly sorted input beats copying out to sorted()
+        # (see Bench_Sort.py). On random input the Python-level merging is
+        # slower than that round trip.
+        if self.length < 2:
+            return
+        try:
+            self._merge_sort(key, reverse)
+        finally:
+            self._reset_finger()
+        if self.debug:
+            self.check_invariants()
+
+    def _merge_sort(self, key, reverse):
+        # Timsort-style natural merge sort on the chain. One pass splits it
+        # into runs (strictly descending runs are flipped, runs shorter than
+        # _SORT_MIN_RUN are topped up by insertion) and pushes them on a
+        # stack that merges neighbouring runs whenever Timsort's length
+        # invariants break, so r runs cost about log2(r) compares per node.
+        if key is not None:
+            # key() once per node: the keys stand in for the values while
+            # sorting and the values are put back on the same nodes after
+            nodes = list(self.iter_nodes())
+            values = [node.value for node in nodes]
+            try:
+                for node in nodes:
+                    node.value = key(node.value)
+                self._merge_sort(None, reverse)
+            finally:
+                for node, value in zip(nodes, values):
+                    node.value = value
+            return
+
+        def reverse_chain(head):
+            tail = head
+            prev = None
+            while head is not None:
+                after = head.next
+                head.next = prev
+                prev = head
+                head = after
+            return prev, tail
+
+        # A comparison may raise at any point. Each helper then leaves its
+        # nodes on whole chains (a run pushed on `runs`, or `rest`), and the
+        # except clause at the bottom joins them back into one list.
+        runs = []
+
+        def take_run():
+            # detaches the run at the front of `rest` and returns it
+            nonlocal rest
+            head = tail = rest
+            after = rest.next
+            length = 1
+            node = None
+            try:
+                if after is not None and after.value < head.value:
+                    # strictly descending: reverse as we go (keeps it stable)
+                    while after is not None and after.value < head.value:
+                        node = after
+                        after = after.next
+                        node.next = head
+                        head = node
+                        node = None
+                        length += 1
+                else:
+                    while after is not None and not after.value < tail.value:
+                        tail = after
+                        after = after.next
+                        length += 1
+                while length < _SORT_MIN_RUN and after is not None:
+                    # insert after any equal values, so ties keep their order
+                    node = after
+                    after = after.next
+                    value = node.value
+                    if not value < tail.value:
+                        tail.next = node
+                        tail = node
+                    elif value < head.value:
+                        node.next = head
+                        head = node
+                    else:
+                        prev = head
+                        while not value < prev.next.value:
+                            prev = prev.next
+                        node.next = prev.next
+                        prev.next = node
+                    node = None
+                    length += 1
+            except BaseException:
+                if node is not None:
+                    # not linked into the run yet; node.next is still `after`
+                    after = node
+                tail.next = None
+                runs.append([head, tail, length])
+                rest = after
+                raise
+            tail.next = None
+            rest = after
+            return [head, tail, length]
+
+        def merge(run, b, b_tail):
+            # Merges the chain b..b_tail, which came after `run`, into `run`.
+            # A b node only goes in front of an a node that is strictly
+            # greater, so ties keep their order. Stretches taken from one
+            # side are already linked; only the switches are relinked.
+            a, a_tail = run[0], run[1]
+            head = a
+            walking_a = True
+            try:
+                if not b.value < a_tail.value:
+                    a_tail.next = b
+                    run[1] = b_tail
+                    return
+                if b_tail.value < a.value:
+                    b_tail.next = a
+                    run[0] = b
+                    return
+                if b.value < a.value:
+                    head = last = b
+                    walking_a = False
+                    b = b.next
+                    while b.value < a.value:
+                        last = b
+                        b = b.next
+                    last.next = a
+                    walking_a = True
+                while True:
+                    # a is next and does not go after b
+                    if b is None:
+                        run[0] = head
+                        return
+                    last = a
+                    a = a.next
+                    while a is not None and not b.value < a.value:
+                        last = a
+                        a = a.next
+                    last.next = b
+                    walking_a = False
+                    if a is None:
+                        run[0], run[1] = head, b_tail
+                        return
+                    # b is next and goes strictly before a
+                    last = b
+                    b = b.next
+                    while b is not None and b.value < a.value:
+                        last = b
+                        b = b.next
+                    last.next = a
+                    walking_a = True
+            except BaseException:
+                # the merged part runs on into the side being walked; hang
+                # the rest of the other side off its end
+                if walking_a:
+                    a_tail.next = b
+                    run[0], run[1] = head, a_tail if b is None else b_tail
+                else:
+                    b_tail.next = a
+                    run[0], run[1] = head, b_tail if a is None else a_tail
+                raise
+
+        def merge_at(i):
+            b, b_tail, b_length = runs.pop(i + 1)
+            runs[i][2] += b_length
+            merge(runs[i], b, b_tail)
+
+        rest = self.head
+        if reverse:
+            # sorting the reversed chain ascending and reversing it back
+            # keeps equal values in their original order
+            rest, _ = reverse_chain(rest)
+        try:
+            while rest is not None:
+                runs.append(take_run())
+                while len(runs) > 1:
+                    n = len(runs) - 2
+                    if ((n > 0 and runs[n - 1][2] <= runs[n][2] + runs[n + 1][2])
+                            or (n > 1 and runs[n - 2][2] <= runs[n - 1][2] + runs[n][2])):
+                        if runs[n - 1][2] < runs[n + 1][2]:
+                            n -= 1
+                    elif runs[n][2] > runs[n + 1][2]:
+                        break
+                    merge_at(n)
+            while len(runs) > 1:
+                merge_at(len(runs) - 2)
+        except BaseException:
+            # Like list.sort, leave every node in the list (in no particular
+            # order) rather than a half-relinked chain
+            head = tail = None
+            for run_head, run_tail, _ in runs:
+                if tail is None:
+                    head = run_head
+                else:
+                    tail.next = run_head
+                tail = run_tail
+            if rest is not None:
+                if tail is None:
+                    head = rest
+                else:
+                    tail.next = rest
+                tail = rest
+                while tail.next is not None:
+                    tail = tail.next
+            self.head = head
+            self.tail = tail
+            raise
+        head, tail, _ = runs[0]
+        if reverse:
+            head, tail = reverse_chain(head)
+        self.head = head
+        self.tail = tail
+
+
+class Cursor:
+    # A position in a LinkedList that only moves forward. Index -1 (the
+    # default) sits before the head, so insert_after/remove_next there act
+    # on the head. Every operation is O(1) apart from the initial get().
+    # DoublyLinkedList.cursor() returns a DoublyCursor, which also keeps
+    # the prev links right.
+    def __init__(self, linked_list, index=-1):
+        self.linked_list = linked_list
+        if index == -1:
+            self.node = None
+        else:
+            self.node = linked_list.get(index)
+            if self.node is None:
+                raise IndexError(f"cursor index {index} out of range")
+        self.index = index
+
+    @property
+    def value(self):
+        return None if self.node is None else self.node.value
+
+    def advance(self, steps=1):
+        # moves up to `steps` nodes; False if the end was reached first
+        for _ in range(steps):
+            after = self.linked_list.head if self.node is None else self.node.next
+            if after is None:
+                return False
+            self.node = after
+            self.index += 1
+        return True
+
+    def insert_after(self, value):
+        ll = self.linked_list
+        if self.node is None:
+            return ll.prepend(value)
+        new_node = Node(value) if ll.pool is None else ll.pool.acquire(value)
+        new_node.next = self.node.next
+        self.node.next = new_node
+        if ll.tail is self.node:
+            ll.tail = new_node
+        ll.length += 1
+        if ll._finger_index > self.index:
+            ll._reset_finger()
+        if ll.debug:
+            ll.check_invariants()
+        return True
+
+    def remove_next(self):
+        ll = self.linked_list
+        if self.node is None:
+            return ll.pop_first()
+        removed_node = self.node.next
+        if removed_node is None:
+            return None
+        self.node.next = removed_node.next
+        removed_node.next = None
+        if ll.tail is removed_node:
+            ll.tail = self.node
+        ll.length -= 1
+        if ll._finger_index > self.index:
+            ll._reset_finger()
+        if ll.debug:
+            ll.check_invariants()
+        return removed_node
+
+
+if __name__ == "__main__":
+    my_linked_list = LinkedList(2)
+
+    # my_linked_list.append(2)
+    # my_linked_list.append(3)
+    # # print(my_linked_list.tail.next)
+    # my_linked_list.print_list()
+    # print()
+    # my_linked_list.pop()
+    # my_linked_list.pop()
+    # my_linked_list.pop()
+    # my_linked_list.pop()
+    # my_linked_list.pop()
+    # # my_linked_list.pop()
+    # my_linked_list.print_list()
+    # print(my_linked_list.length)
+    my_linked_list.prepend(1)
+    my_linked_list.print_list()
+    print(my_linked_list.length)
+
+    empty_list = LinkedList()
+    print(empty_list.length, empty_list.head)
+
+    bulk_list = LinkedList.from_iterable(range(3))
+    bulk_list.extend([3, 4])
+    bulk_list.print_list()
+    print(bulk_list.length, bulk_list.tail.value)
+
+    print(list(bulk_list), len(bulk_list))
+    print([node.value for node in bulk_list.iter_nodes()])
+
+    # extend attaches the new nodes only once the iterable is exhausted
+    def values_then_error():
+        yield 5
+        raise RuntimeError("source failed")
+
+    try:
+        bulk_list.extend(values_then_error())
+    except RuntimeError:
+        print(list(bulk_list), bulk_list.length, bulk_list.tail.value)
+    doubled = LinkedList.from_iterable([1, 2])
+    doubled.extend(doubled)
+    print(list(doubled), doubled.length)
+
+    # sequential get() resumes from the finger instead of the head
+    print([bulk_list.get(i).value for i in range(bulk_list.length)])
+
+    # cursor: walk to index 1, insert after it, then drop the node after that
+    cursor = bulk_list.cursor(1)
+    cursor.insert_after(10)
+    cursor.advance()
+    print(cursor.index, cursor.value, cursor.remove_next().value, list(bulk_list))
+
+    # stable sort relinks the existing nodes
+    records = LinkedList.from_iterable([(3, "a"), (1, "b"), (3, "c"), (2, "d")])
+    records.sort(key=lambda record: record[0])
+    print(list(records))
+
+    # a compare that raises still leaves every node in the list
+    mixed = LinkedList.from_iterable([3, 1, "a", 2])
+    try:
+        mixed.sort()
+    except TypeError:
+        print(sorted(map(str, mixed)), mixed.length)
+
+    # moving whole segments between lists without copying nodes
+    left = LinkedList.from_iterable(range(6))
+    right = left.split_at(4)
+    print(list(left), list(right), left.tail.value, right.length)
+    left.concat(right)
+    left.splice(left.get(0), LinkedList.from_iterable(["x", "y"]))
+    print(list(left), left.length, right.length)
+
+    # with a NodePool, the *_value removals hand their nodes back for reuse
+    from NodePool import NodePool
+    pool = NodePool(cap=8)
+    churn = LinkedList.from_iterable(range(3), pool=pool)
+    print(churn.pop_first_value(), churn.remove_value(1), churn.pop_value(), pool.size)
+    churn.extend("ab")
+    print(list(churn), pool.hits, pool.misses, pool.size)
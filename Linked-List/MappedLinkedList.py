@@ -0,0 +1,127 @@
+import array
+import mmap
+import sys
+
+from LinkedList import _DUMP_HEADER, _read_dump_header
+
+
+class MappedLinkedList:
+    # Read-only view of a file written by LinkedList.dump().
+    #
+    # The file is mmap'ed and the values are read through a memoryview cast
+    # to the dump's typecode, so opening only parses the 16-byte header and
+    # the OS pages values in as they are touched: a multi-GB dump opens
+    # instantly. get(index) is O(1) and returns the value (there are no
+    # nodes); LinkedList.from_iterable(view) copies it into a real list.
+    #
+    # The dump's little-endian values are read in native order, so this is
+    # not supported on big-endian hosts; use LinkedList.load() there.
+    def __init__(self, path):
+        if sys.byteorder != "little":
+            raise ValueError("MappedLinkedList needs a little-endian host; use LinkedList.load()")
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self.typecode, self.length = _read_dump_header(self._mmap)
+            end = _DUMP_HEADER.size + self.length * array.array(self.typecode).itemsize
+            if len(self._mmap) < end:
+                raise ValueError("LinkedList dump is truncated")
+            self._values = memoryview(self._mmap)[_DUMP_HEADER.size:end].cast(self.typecode)
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self):
+        # the memoryview must be released before the map can be closed
+        values = getattr(self, "_values", None)
+        if values is not None:
+            values.release()
+            self._values = None
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        yield from self._values
+
+    def get(self, index):
+        if index < 0 or index >= self.length:
+            return None
+        return self._values[index]
+
+    def print_list(self, file=None):
+        if file is None:
+            file = sys.stdout
+        file.writelines(str(value) + "\n" for value in self)
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    from LinkedList import LinkedList
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "ints.llb")
+        ll = LinkedList.from_iterable([5, -1, 2**40, 0])
+        ll.dump(path)
+        print("file size:", os.path.getsize(path))
+        print("load:", list(LinkedList.load(path)))
+
+        with MappedLinkedList(path) as view:
+            print("mapped:", (len(view), view.get(2), view.get(4), list(view)))
+
+        path = os.path.join(directory, "floats.llb")
+        LinkedList.from_iterable([0.5, 1.25]).dump(path, typecode="d")
+        with MappedLinkedList(path) as view:
+            print("floats:", (view.typecode, list(view)))
+
+        path = os.path.join(directory, "empty.llb")
+        LinkedList().dump(path)
+        with MappedLinkedList(path) as view:
+            print("empty:", (LinkedList.load(path).length, len(view), list(view)))
+
+        # a value that does not fit "q" fails the dump but keeps the old file
+        path = os.path.join(directory, "ints.llb")
+        try:
+            LinkedList.from_iterable([1, 2**70]).dump(path)
+        except OverflowError:
+            print("failed dump:", (list(LinkedList.load(path)), sorted(os.listdir(directory))))
+        with open(path, "r+b") as file:
+            file.truncate(16 + 3 * 8 + 5)
+        for opener in (LinkedList.load, MappedLinkedList):
+            try:
+                opener(path)
+            except ValueError as error:
+                print("truncated:", error)
+
+        path = os.path.join(directory, "text.txt")
+        with open(path, "w") as file:
+            file.write("not a dump at all\n")
+        try:
+            LinkedList.load(path)
+        except ValueError as error:
+            print("bad file:", error)
+
+
+"""
+    EXPECTED OUTPUT:
+    ----------------
+    file size: 48
+    load: [5, -1, 1099511627776, 0]
+    mapped: (4, 1099511627776, None, [5, -1, 1099511627776, 0])
+    floats: ('d', [0.5, 1.25])
+    empty: (0, 0, [])
+    failed dump: ([5, -1, 1099511627776, 0], ['empty.llb', 'floats.llb', 'ints.llb'])
+    truncated: LinkedList dump is truncated
+    truncated: LinkedList dump is truncated
+    bad file: not a LinkedList dump
+
+"""
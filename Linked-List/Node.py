@@ -0,0 +1,8 @@
+class Node:
+    # __slots__ drops the per-instance __dict__, so each node only carries
+    # room for its two references. Every list in this folder shares it.
+    __slots__ = ("value", "next")
+
+    def __init__(self, value):
+        self.value = value
+        self.next = None
@@ -0,0 +1,79 @@
+from Node import Node
+
+
+class NodePool:
+    # Free list of detached nodes for a LinkedList (or several lists) to reuse.
+    #
+    # The free nodes are chained through their own next pointers, so the pool
+    # costs nothing beyond the nodes it holds. acquire() hands out a free
+    # node when there is one (a hit) and builds a new node_class otherwise
+    # (a miss); release() takes a node back unless `cap` nodes are already
+    # held. trim() frees held nodes for the garbage collector.
+    def __init__(self, node_class=Node, cap=1024):
+        if cap < 0:
+            raise ValueError("cap must not be negative")
+        self.node_class = node_class
+        self.cap = cap
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._free = None
+
+    def __len__(self):
+        return self.size
+
+    def acquire(self, value):
+        node = self._free
+        if node is None:
+            self.misses += 1
+            return self.node_class(value)
+        self._free = node.next
+        node.next = None
+        node.value = value
+        self.size -= 1
+        self.hits += 1
+        return node
+
+    def release(self, node):
+        # the node must already be unlinked from its list
+        if self.size >= self.cap:
+            return False
+        node.value = None
+        node.next = self._free
+        self._free = node
+        self.size += 1
+        return True
+
+    def trim(self, size=0):
+        # drop free nodes until at most `size` are left
+        if size < 0:
+            raise ValueError("size must not be negative")
+        while self.size > size:
+            node = self._free
+            self._free = node.next
+            node.next = None
+            self.size -= 1
+
+
+if __name__ == "__main__":
+    pool = NodePool(cap=2)
+    nodes = [pool.acquire(i) for i in range(3)]
+    print([node.value for node in nodes], pool.hits, pool.misses, pool.size)
+
+    print([pool.release(node) for node in nodes], pool.size)
+    reused = pool.acquire("x")
+    print(reused is nodes[1], reused.value, reused.next, pool.hits, pool.size)
+
+    pool.trim()
+    print(pool.size, pool.acquire("y") is nodes[0], pool.misses)
+
+
+"""
+    EXPECTED OUTPUT:
+    ----------------
+    [0, 1, 2] 0 3 0
+    [True, True, False] 2
+    True x None 1 1
+    0 False 4
+
+"""
@@ -0,0 +1,225 @@
+import sys
+
+from Node import Node
+from LinkedList import _EMPTY
+
+
+class PersistentLinkedList:
+    # Immutable LinkedList: every edit returns a new version and leaves the
+    # old one intact, so keeping a snapshot is just keeping a reference.
+    #
+    # Versions share nodes. prepend and pop_first are O(1) and share the
+    # whole chain; insert/remove/set_value copy only the nodes before the
+    # edit point and share everything after it; concat copies this list and
+    # shares all of `other`. Shared nodes must never be mutated, so do not
+    # assign to the value/next of a node returned by get().
+    #
+    # Edits that are out of range (or pop_first on an empty list) return
+    # None, the same cases in which LinkedList returns False/None.
+    debug = False
+
+    def __init__(self, value=_EMPTY):
+        self.head = None
+        self.tail = None
+        self.length = 0
+        if value is not _EMPTY:
+            self.head = self.tail = Node(value)
+            self.length = 1
+
+    @classmethod
+    def _make(cls, head, tail, length):
+        new_list = cls()
+        new_list.head = head
+        new_list.tail = tail
+        new_list.length = length
+        if cls.debug:
+            new_list.check_invariants()
+        return new_list
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        head = tail = None
+        count = 0
+        for value in iterable:
+            new_node = Node(value)
+            if tail is None:
+                head = new_node
+            else:
+                tail.next = new_node
+            tail = new_node
+            count += 1
+        return cls._make(head, tail, count)
+
+    def check_invariants(self):
+        count = 0
+        last = None
+        temp = self.head
+        while temp is not None and count <= self.length:
+            last = temp
+            temp = temp.next
+            count += 1
+        assert count == self.length, f"length is {self.length} but chain has {count}+ nodes"
+        assert last is self.tail, "tail is not the last node of the chain"
+        return True
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        temp = self.head
+        while temp is not None:
+            yield temp.value
+            temp = temp.next
+
+    def iter_nodes(self):
+        temp = self.head
+        while temp is not None:
+            yield temp
+            temp = temp.next
+
+    def print_list(self, file=None):
+        if file is None:
+            file = sys.stdout
+        file.writelines(str(value) + "\n" for value in self)
+
+    def _copy_prefix(self, count):
+        # Copies the first `count` nodes. Returns the copy's first and last
+        # node and the original node at position `count`.
+        first = last = None
+        temp = self.head
+        for _ in range(count):
+            new_node = Node(temp.value)
+            if last is None:
+                first = new_node
+            else:
+                last.next = new_node
+            last = new_node
+            temp = temp.next
+        return first, last, temp
+
+    def get(self, index):
+        if index < 0 or index >= self.length:
+            return None
+        if index == self.length - 1:
+            return self.tail
+        temp = self.head
+        for _ in range(index):
+            temp = temp.next
+        return temp
+
+    def prepend(self, value):
+        new_node = Node(value)
+        new_node.next = self.head
+        return self._make(new_node, self.tail or new_node, self.length + 1)
+
+    def pop_first(self):
+        # the popped value is self.head.value
+        if self.length == 0:
+            return None
+        if self.length == 1:
+            return self._make(None, None, 0)
+        return self._make(self.head.next, self.tail, self.length - 1)
+
+    def insert(self, index, value):
+        if index < 0 or index > self.length:
+            return None
+        if index == 0:
+            return self.prepend(value)
+        first, last, rest = self._copy_prefix(index)
+        new_node = Node(value)
+        last.next = new_node
+        new_node.next = rest
+        return self._make(first, self.tail if rest is not None else new_node, self.length + 1)
+
+    def append(self, value):
+        # copies every node: appending is O(n) on a persistent list
+        return self.insert(self.length, value)
+
+    def set_value(self, index, value):
+        if index < 0 or index >= self.length:
+            return None
+        first, last, old = self._copy_prefix(index)
+        new_node = Node(value)
+        new_node.next = old.next
+        if last is None:
+            first = new_node
+        else:
+            last.next = new_node
+        return self._make(first, self.tail if old.next is not None else new_node, self.length)
+
+    def remove(self, index):
+        if index < 0 or index >= self.length:
+            return None
+        if index == 0:
+            return self.pop_first()
+        first, last, old = self._copy_prefix(index)
+        last.next = old.next
+        return self._make(first, self.tail if old.next is not None else last, self.length - 1)
+
+    def pop(self):
+        # the popped value is self.tail.value
+        if self.length == 0:
+            return None
+        return self.remove(self.length - 1)
+
+    def concat(self, other):
+        # copies this list and shares all of `other`
+        if other.length == 0:
+            return self
+        if self.length == 0:
+            return other
+        first, last, _ = self._copy_prefix(self.length)
+        last.next = other.head
+        return self._make(first, other.tail, self.length + other.length)
+
+    def reverse(self):
+        head = tail = None
+        for value in self:
+            new_node = Node(value)
+            new_node.next = head
+            head = new_node
+            if tail is None:
+                tail = new_node
+        return self._make(head, tail, self.length)
+
+
+if __name__ == "__main__":
+    v1 = PersistentLinkedList.from_iterable([1, 2, 3, 4])
+    v2 = v1.prepend(0)
+    v3 = v2.pop_first().pop_first()
+    print("prepend/pop_first:", (list(v1), list(v2), list(v3)))
+    print("whole chain shared:", (v2.head.next is v1.head, v3.head is v1.head.next))
+
+    v4 = v1.insert(2, 9)
+    print("insert:", (list(v4), list(v1)))
+    print("suffix shared:", (v4.get(3) is v1.get(2), v4.get(1) is v1.get(1)))
+
+    v5 = v4.remove(0).set_value(3, 40)
+    print("remove/set_value:", (list(v5), v5.tail.value, list(v4)))
+
+    v6 = v1.concat(v5)
+    print("concat:", (list(v6), v6.length, v6.tail is v5.tail))
+    print("append/pop/reverse:", (list(v1.append(5)), list(v1.pop()), list(v1.reverse()), v1.reverse().tail.value))
+    print("out of range:", (v1.insert(9, 0), v1.remove(-1), PersistentLinkedList().pop_first()))
+
+    # snapshots for rollback are just references to old versions
+    history = [PersistentLinkedList()]
+    for value in range(5):
+        history.append(history[-1].prepend(value))
+    print("rollback:", (list(history[-1]), list(history[2])))
+
+
+"""
+    EXPECTED OUTPUT:
+    ----------------
+    prepend/pop_first: ([1, 2, 3, 4], [0, 1, 2, 3, 4], [2, 3, 4])
+    whole chain shared: (True, True)
+    insert: ([1, 2, 9, 3, 4], [1, 2, 3, 4])
+    suffix shared: (True, False)
+    remove/set_value: ([2, 9, 3, 40], 40, [1, 2, 9, 3, 4])
+    concat: ([1, 2, 3, 4, 2, 9, 3, 40], 8, True)
+    append/pop/reverse: ([1, 2, 3, 4, 5], [1, 2, 3], [4, 3, 2, 1], 1)
+    out of range: (None, None, None)
+    rollback: ([4, 3, 2, 1, 0], [1, 0])
+
+"""
@@ -0,0 +1,137 @@
+from Node import Node
+
+
+class SPSCQueue:
+    # Single-producer / single-consumer queue on a preallocated ring of Nodes.
+    #
+    # The ring has capacity + 1 nodes linked in a circle and is never
+    # relinked: append writes into the node at tail and steps tail forward,
+    # pop_first reads the node at head and steps head forward. Nodes are
+    # reused forever, so steady-state traffic allocates nothing.
+    #
+    # head == tail means empty; tail.next == head means full (one node is
+    # always left free so the two cases differ). The producer is the only
+    # writer of tail and _appended, the consumer the only writer of head and
+    # _popped, so one producer thread and one consumer thread need no lock:
+    # each side publishes its step with a single attribute store, and the
+    # value is written before tail moves past it.
+    #
+    # Like ConcurrentLinkedList, values are returned instead of nodes:
+    # nodes stay owned by the ring. pop_first returns None for an empty
+    # ring, so append rejects None (ValueError) to keep that unambiguous.
+    def __init__(self, capacity):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        first = Node(None)
+        temp = first
+        for _ in range(capacity):
+            temp.next = Node(None)
+            temp = temp.next
+        temp.next = first
+        self.head = first
+        self.tail = first
+        self._appended = 0
+        self._popped = 0
+
+    @property
+    def length(self):
+        return self._appended - self._popped
+
+    def __len__(self):
+        return self._appended - self._popped
+
+    def empty(self):
+        return self.head is self.tail
+
+    def full(self):
+        return self.tail.next is self.head
+
+    def __iter__(self):
+        # consumer side only; a concurrent append may or may not be seen
+        temp = self.head
+        tail = self.tail
+        while temp is not tail:
+            yield temp.value
+            temp = temp.next
+
+    def print_list(self):
+        for value in self:
+            print(value)
+
+    def append(self, value):
+        if value is None:
+            raise ValueError("SPSCQueue cannot hold None")
+        tail = self.tail
+        if tail.next is self.head:
+            return False
+        tail.value = value
+        self.tail = tail.next
+        self._appended += 1
+        return True
+
+    def pop_first(self):
+        head = self.head
+        if head is self.tail:
+            return None
+        value = head.value
+        head.value = None
+        self.head = head.next
+        self._popped += 1
+        return value
+
+
+if __name__ == "__main__":
+    import threading
+    import time
+
+    queue = SPSCQueue(3)
+    print("fill:", [queue.append(v) for v in (1, 2, 3, 4)])
+    print("contents:", (list(queue), queue.length, queue.full()))
+    print("pop_first:", [queue.pop_first(), queue.pop_first()])
+    queue.append(5)
+    queue.append(6)
+    print("wrap around:", [queue.pop_first() for _ in range(4)])
+    try:
+        queue.append(None)
+    except ValueError as error:
+        print("append None:", error)
+
+    # one producer thread, one consumer thread, a small ring so both sides
+    # keep hitting full / empty; sleep(0) hands over the GIL while waiting
+    queue = SPSCQueue(64)
+    count = 20_000
+    received = []
+
+    def producer():
+        for i in range(count):
+            while not queue.append(i):
+                time.sleep(0)
+
+    def consumer():
+        while len(received) < count:
+            value = queue.pop_first()
+            if value is not None:
+                received.append(value)
+            else:
+                time.sleep(0)
+
+    threads = [threading.Thread(target=producer), threading.Thread(target=consumer)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    print("two threads:", (received == list(range(count)), queue.length))
+
+
+"""
+    EXPECTED OUTPUT:
+    ----------------
+    fill: [True, True, True, False]
+    contents: ([1, 2, 3], 3, True)
+    pop_first: [1, 2]
+    wrap around: [3, 5, 6, None]
+    append None: SPSCQueue cannot hold None
+    two threads: (True, 0)
+
+"""
@@ -0,0 +1,177 @@
+import random
+
+MAX_LEVEL = 32
+
+
+class SkipNode:
+    __slots__ = ("value", "next", "width")
+
+    def __init__(self, value, level):
+        self.value = value
+        self.next = [None] * level
+        # width[i] is how many positions next[i] jumps over; a link that
+        # runs off the end counts up to position `length`
+        self.width = [1] * level
+
+
+class SkipList:
+    # Positional skip list: same get/set_value/insert/remove API as
+    # LinkedList, but the express lanes store span widths, so finding the
+    # node at an index is an expected O(log n) walk instead of O(n).
+    def __init__(self, value):
+        self.head = SkipNode(None, MAX_LEVEL)
+        self.level = 1
+        self.length = 0
+        self.append(value)
+
+    def _random_level(self):
+        level = 1
+        while level < MAX_LEVEL and random.getrandbits(1):
+            level += 1
+        return level
+
+    def _find_before(self, index):
+        # last node before `index` on each level, and its position
+        chain = [None] * self.level
+        positions = [0] * self.level
+        node = self.head
+        position = -1
+        for lvl in range(self.level - 1, -1, -1):
+            while node.next[lvl] is not None and position + node.width[lvl] < index:
+                position += node.width[lvl]
+                node = node.next[lvl]
+            chain[lvl] = node
+            positions[lvl] = position
+        return chain, positions
+
+    def print_list(self):
+        temp = self.head.next[0]
+        while temp is not None:
+            print(temp.value)
+            temp = temp.next[0]
+
+    def get(self, index):
+        if index < 0 or index >= self.length:
+            return None
+        node = self.head
+        position = -1
+        for lvl in range(self.level - 1, -1, -1):
+            while node.next[lvl] is not None and position + node.width[lvl] <= index:
+                position += node.width[lvl]
+                node = node.next[lvl]
+        return node
+
+    def set_value(self, index, value):
+        temp = self.get(index)
+        if temp:
+            temp.value = value
+            return True
+        return False
+
+    def insert(self, index, value):
+        if index < 0 or index > self.length:
+            return False
+        new_level = self._random_level()
+        if new_level > self.level:
+            # fresh lanes on head start out spanning the whole list
+            for lvl in range(self.level, new_level):
+                self.head.next[lvl] = None
+                self.head.width[lvl] = self.length + 1
+            self.level = new_level
+        chain, positions = self._find_before(index)
+        new_node = SkipNode(value, new_level)
+        for lvl in range(new_level):
+            before = chain[lvl]
+            span = index - positions[lvl]
+            new_node.next[lvl] = before.next[lvl]
+            new_node.width[lvl] = before.width[lvl] - span + 1
+            before.next[lvl] = new_node
+            before.width[lvl] = span
+        for lvl in range(new_level, self.level):
+            chain[lvl].width[lvl] += 1
+        self.length += 1
+        return True
+
+    def remove(self, index):
+        if index < 0 or index >= self.length:
+            return None
+        chain, _ = self._find_before(index)
+        removed_node = chain[0].next[0]
+        for lvl in range(self.level):
+            before = chain[lvl]
+            if before.next[lvl] is removed_node:
+                before.width[lvl] += removed_node.width[lvl] - 1
+                before.next[lvl] = removed_node.next[lvl]
+            else:
+                before.width[lvl] -= 1
+        while self.level > 1 and self.head.next[self.level - 1] is None:
+            self.level -= 1
+        self.length -= 1
+        return removed_node
+
+    def append(self, value):
+        return self.insert(self.length, value)
+
+    def prepend(self, value):
+        return self.insert(0, value)
+
+    def pop(self):
+        return self.remove(self.length - 1)
+
+    def pop_first(self):
+        return self.remove(0)
+
+
+if __name__ == "__main__":
+    def to_list(sl):
+        result = []
+        temp = sl.head.next[0]
+        while temp is not None:
+            result.append(temp.value)
+            temp = temp.next[0]
+        return result
+
+    sl = SkipList(0)
+    for value in range(1, 10):
+        sl.append(value)
+    print("append:", to_list(sl))
+    print("get:", [sl.get(i).value for i in range(10)])
+
+    sl.insert(3, 30)
+    sl.prepend(-1)
+    print("insert/prepend:", to_list(sl))
+    print("remove:", sl.remove(4).value)
+    print("pop:", sl.pop().value)
+    print("pop_first:", sl.pop_first().value)
+    sl.set_value(5, 50)
+    print("set_value:", sl.get(5).value)
+    print("out of range:", (sl.get(sl.length), sl.insert(-1, 0), sl.remove(99)))
+
+    # random positional edits against a plain Python list
+    random.seed(7)
+    expected = to_list(sl)
+    for step in range(2000):
+        index = random.randint(0, len(expected))
+        if expected and random.random() < 0.5:
+            index = min(index, len(expected) - 1)
+            assert sl.remove(index).value == expected.pop(index)
+        else:
+            sl.insert(index, step)
+            expected.insert(index, step)
+    print("random edits:", to_list(sl) == expected and sl.length == len(expected))
+
+
+"""
+    EXPECTED OUTPUT:
+    ----------------
+    append: [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
+    get: [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
+    insert/prepend: [-1, 0, 1, 2, 30, 3, 4, 5, 6, 7, 8, 9]
+    remove: 30
+    pop: 9
+    pop_first: -1
+    set_value: 50
+    out of range: (None, False, None)
+    random edits: True
+
+"""
@@ -0,0 +1,207 @@
+class Block:
+    __slots__ = ("values", "next")
+
+    def __init__(self, values):
+        self.values = values
+        self.next = None
+
+
+class UnrolledLinkedList:
+    # Same interface as LinkedList, but each node (Block) holds up to
+    # block_size values in a Python list. Scans touch one object per block
+    # instead of one per value; a block that overflows on insert splits in
+    # half, and a block that drops below half full after remove merges with
+    # its successor when both fit in one block.
+    #
+    # get() returns the value itself since values no longer have a node each.
+    def __init__(self, value, block_size=32):
+        if block_size < 2:
+            raise ValueError("block_size must be at least 2")
+        self.block_size = block_size
+        new_block = Block([value])
+        self.head = new_block
+        self.tail = new_block
+        self.length = 1
+
+    def _locate(self, index):
+        # block holding `index`, the block before it, and the offset inside
+        prev = None
+        block = self.head
+        while index >= len(block.values):
+            index -= len(block.values)
+            prev = block
+            block = block.next
+        return prev, block, index
+
+    def print_list(self):
+        block = self.head
+        while block is not None:
+            for value in block.values:
+                print(value)
+            block = block.next
+
+    def append(self, value):
+        if self.tail is None:
+            self.head = self.tail = Block([value])
+        elif len(self.tail.values) < self.block_size:
+            self.tail.values.append(value)
+        else:
+            # start a new block so sequential appends leave full blocks behind
+            new_block = Block([value])
+            self.tail.next = new_block
+            self.tail = new_block
+        self.length += 1
+        return True
+
+    def prepend(self, value):
+        if self.head is None:
+            self.head = self.tail = Block([value])
+        elif len(self.head.values) < self.block_size:
+            self.head.values.insert(0, value)
+        else:
+            new_block = Block([value])
+            new_block.next = self.head
+            self.head = new_block
+        self.length += 1
+        return True
+
+    def get(self, index):
+        if index < 0 or index >= self.length:
+            return None
+        _, block, offset = self._locate(index)
+        return block.values[offset]
+
+    def set_value(self, index, value):
+        if index < 0 or index >= self.length:
+            return False
+        _, block, offset = self._locate(index)
+        block.values[offset] = value
+        return True
+
+    def insert(self, index, value):
+        if index < 0 or index > self.length:
+            return False
+        if index == 0:
+            return self.prepend(value)
+        if index == self.length:
+            return self.append(value)
+        _, block, offset = self._locate(index)
+        block.values.insert(offset, value)
+        if len(block.values) > self.block_size:
+            half = len(block.values) // 2
+            new_block = Block(block.values[half:])
+            del block.values[half:]
+            new_block.next = block.next
+            block.next = new_block
+            if self.tail is block:
+                self.tail = new_block
+        self.length += 1
+        return True
+
+    def remove(self, index):
+        if index < 0 or index >= self.length:
+            return None
+        prev, block, offset = self._locate(index)
+        value = block.values.pop(offset)
+        self.length -= 1
+        if not block.values:
+            if prev is None:
+                self.head = block.next
+            else:
+                prev.next = block.next
+            if self.tail is block:
+                self.tail = prev
+        elif len(block.values) < self.block_size // 2 and block.next is not None:
+            after = block.next
+            if len(block.values) + len(after.values) <= self.block_size:
+                block.values.extend(after.values)
+                block.next = after.next
+                if self.tail is after:
+                    self.tail = block
+        return value
+
+    def pop(self):
+        return self.remove(self.length - 1)
+
+    def pop_first(self):
+        return self.remove(0)
+
+    def reverse(self):
+        block = self.head
+        self.head = self.tail
+        self.tail = block
+        before = None
+        while block is not None:
+            after = block.next
+            block.next = before
+            block.values.reverse()
+            before = block
+            block = after
+
+
+if __name__ == "__main__":
+    def to_list(ull):
+        result = []
+        block = ull.head
+        while block is not None:
+            assert 0 < len(block.values) <= ull.block_size
+            result.extend(block.values)
+            if block.next is None:
+                assert block is ull.tail
+            block = block.next
+        assert len(result) == ull.length
+        return result
+
+    ull = UnrolledLinkedList(0, block_size=4)
+    for value in range(1, 10):
+        ull.append(value)
+    print("append:", to_list(ull))
+
+    ull.prepend(-1)
+    ull.insert(5, 40)
+    ull.insert(5, 41)
+    print("insert splits:", to_list(ull))
+    print("get:", ull.get(6))
+    ull.set_value(0, -10)
+    print("set_value:", ull.get(0))
+
+    print("remove:", [ull.remove(5), ull.remove(5)])
+    print("pop/pop_first:", [ull.pop(), ull.pop_first()])
+
+    ull.reverse()
+    print("reverse:", to_list(ull))
+
+    while ull.length > 1:
+        ull.remove(ull.length // 2)
+    print("shrunk:", (to_list(ull), ull.head is ull.tail))
+
+    # random edits against a plain Python list
+    import random
+    random.seed(3)
+    ull = UnrolledLinkedList(0, block_size=8)
+    expected = [0]
+    for step in range(3000):
+        index = random.randint(0, len(expected))
+        if expected and random.random() < 0.45:
+            index = min(index, len(expected) - 1)
+            assert ull.remove(index) == expected.pop(index)
+        else:
+            ull.insert(index, step)
+            expected.insert(index, step)
+    print("random edits:", to_list(ull) == expected)
+
+
+"""
+    EXPECTED OUTPUT:
+    ----------------
+    append: [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
+    insert splits: [-1, 0, 1, 2, 3, 41, 40, 4, 5, 6, 7, 8, 9]
+    get: 40
+    set_value: -10
+    remove: [41, 40]
+    pop/pop_first: [9, -10]
+    reverse: [8, 7, 6, 5, 4, 3, 2, 1, 0]
+    shrunk: ([8], True)
+    random edits: True
+
+"""
@@ -0,0 +1,146 @@
+import functools
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from LinkedList import LinkedList
+
+# Lists shorter than this are processed in the calling process: for small
+# inputs, starting workers and pickling values costs more than it saves.
+SERIAL_THRESHOLD = 10_000
+CHUNK_SIZE = 50_000
+
+_MISSING = object()
+
+
+def _check_chunk_size(chunk_size):
+    # islice(values, 0) would end the walk at once and silently drop every value
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+
+def _segments(linked_list, chunk_size):
+    # contiguous runs of values, read off the chain in a single walk
+    values = iter(linked_list)
+    while True:
+        segment = list(islice(values, chunk_size))
+        if not segment:
+            return
+        yield segment
+
+
+def _map_segment(function, segment):
+    return [function(value) for value in segment]
+
+
+def _filter_segment(predicate, segment):
+    return [value for value in segment if predicate(value)]
+
+
+def _reduce_segment(function, segment):
+    return functools.reduce(function, segment)
+
+
+def _run_in_order(worker, linked_list, chunk_size, max_workers):
+    # Yields each segment's result in list order. Only a few segments per
+    # worker are in flight at once, so the values are never all copied
+    # out of the list at the same time.
+    max_workers = max_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        in_flight = deque()
+        window = max_workers * 2
+        for segment in _segments(linked_list, chunk_size):
+            in_flight.append(executor.submit(worker, segment))
+            if len(in_flight) >= window:
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
+
+
+# `function` / `predicate` must be picklable (defined at module level, not a
+# lambda) because they are shipped to the worker processes.
+
+def parallel_map(function, linked_list, chunk_size=CHUNK_SIZE, max_workers=None,
+                 serial_threshold=SERIAL_THRESHOLD):
+    _check_chunk_size(chunk_size)
+    if linked_list.length < serial_threshold:
+        return LinkedList.from_iterable(map(function, linked_list))
+    result = LinkedList()
+    worker = functools.partial(_map_segment, function)
+    for values in _run_in_order(worker, linked_list, chunk_size, max_workers):
+        result.extend(values)
+    return result
+
+
+def parallel_filter(predicate, linked_list, chunk_size=CHUNK_SIZE, max_workers=None,
+                    serial_threshold=SERIAL_THRESHOLD):
+    _check_chunk_size(chunk_size)
+    if linked_list.length < serial_threshold:
+        return LinkedList.from_iterable(filter(predicate, linked_list))
+    result = LinkedList()
+    worker = functools.partial(_filter_segment, predicate)
+    for values in _run_in_order(worker, linked_list, chunk_size, max_workers):
+        result.extend(values)
+    return result
+
+
+def parallel_reduce(function, linked_list, initial=_MISSING, chunk_size=CHUNK_SIZE,
+                    max_workers=None, serial_threshold=SERIAL_THRESHOLD):
+    # Each segment is reduced in a worker and the partial results are then
+    # reduced in order here, so `function` must be associative.
+    _check_chunk_size(chunk_size)
+    if linked_list.length < serial_threshold:
+        partials = linked_list
+    else:
+        worker = functools.partial(_reduce_segment, function)
+        partials = _run_in_order(worker, linked_list, chunk_size, max_workers)
+    if initial is _MISSING:
+        return functools.reduce(function, partials)
+    return functools.reduce(function, partials, initial)
+
+
+def _is_prime(n):
+    if n < 2:
+        return False
+    i = 2
+    while i * i <= n:
+        if n % i == 0:
+            return False
+        i += 1
+    return True
+
+
+def _square(n):
+    return n * n
+
+
+def _add(a, b):
+    return a + b
+
+
+if __name__ == "__main__":
+    numbers = LinkedList.from_iterable(range(200_000))
+
+    primes = parallel_filter(_is_prime, numbers, chunk_size=20_000)
+    print(primes.length, list(primes)[:5], primes.tail.value)
+
+    squares = parallel_map(_square, numbers, chunk_size=20_000)
+    print(squares.length, squares.get(199_999).value)
+
+    print(parallel_reduce(_add, numbers, chunk_size=20_000), sum(range(200_000)))
+
+    # below the threshold everything runs in this process
+    small = LinkedList.from_iterable(range(10))
+    print(list(parallel_map(_square, small)), parallel_reduce(_add, small, 100))
+
+
+"""
+    EXPECTED OUTPUT:
+    ----------------
+    17984 [2, 3, 5, 7, 11] 199999
+    200000 39999600001
+    19999900000 19999900000
+    [0, 1, 4, 9, 16, 25, 36, 49, 64, 81] 145
+
+"""
@@ -1,4 +1,6 @@
 class Node:
+    __slots__ = ("value", "next")
+
     def __init__(self,value):
         self.value = value
         self.next = None